@@ -0,0 +1,37 @@
+"""
+Engine entry point.
+
+    python -m rqe              # or `rqe` once installed
+    python -m rqe --check      # build everything, log startup timing, exit
+
+Loads `.env` (if present) before reading configuration, then hands over to
+rqe.engine.run. Everything heavy is imported after the start clock so the
+"startup" log line reports the real cold-start cost.
+"""
+
+import time
+
+_T0 = time.perf_counter()
+
+import argparse  # noqa: E402
+import os  # noqa: E402
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(prog="rqe", description="Run the trading engine.")
+    ap.add_argument("--env-file", default=".env", help="dotenv file to load if it exists ('' to skip)")
+    ap.add_argument("--check", action="store_true", help="build the engine, log startup timing and exit")
+    args = ap.parse_args(argv)
+
+    if args.env_file and os.path.exists(args.env_file):
+        from dotenv import load_dotenv
+
+        load_dotenv(args.env_file)
+
+    from .engine import run
+
+    run(t0=_T0, check=args.check)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Tick-path micro-benchmark: Engine.tick() on a synthetic in-process feed.
+
+No network and no SQLite: the public REST client is replaced by a precomputed
+price path and the store by a no-op, so what is left is the engine's own
+per-tick work (strategies, risk, allocation, broker, bookkeeping). Reports
+time per tick, GC collections per generation and GC pause time, then a second
+pass under tracemalloc for peak / retained allocations and the average
+transient peak inside one tick (what the tick allocates and frees again).
+
+    python -m rqe.bench --ticks 20000
+    python -m rqe.bench --exec-style twap
+    python -m rqe.bench --log-sample tick=10   # INFO logging through the real pipeline, to /dev/null
+"""
+
+import argparse
+import contextlib
+import gc
+import logging
+import math
+import os
+import random
+import time
+import tracemalloc
+
+from .config import Settings
+from .engine import Engine
+from .exchange.binance_public import Ticker
+from .log import setup as setup_logging, shutdown as shutdown_logging
+from .storage import DailyState
+
+
+class _Feed:
+    """Stands in for BinancePublic: a fixed random-walk-plus-cycle path per symbol."""
+
+    def __init__(self, symbols, n: int, seed: int = 7) -> None:
+        rnd = random.Random(seed)
+        self.paths = {}
+        for k, sym in enumerate(symbols):
+            px, path = 100.0 * (k + 1), []
+            for i in range(n):
+                px *= 1.0 + rnd.gauss(0.0, 5e-4) + 2e-3 * math.sin(i / 50.0) / 50.0
+                path.append(px)
+            self.paths[sym] = path
+        self.n = n
+        self.i = {sym: 0 for sym in symbols}
+
+    def price(self, symbol: str, out=None) -> Ticker:
+        i = self.i[symbol]
+        self.i[symbol] = i + 1
+        if out is None:
+            out = Ticker(0.0, 0.0)
+        out.price = self.paths[symbol][i % self.n]
+        out.latency_ms = 1.0
+        return out
+
+
+class _NullStore:
+    def __init__(self) -> None:
+        self.daily = DailyState("bench", 0, 0.0, 0)
+
+    def get_daily(self) -> DailyState:
+        return self.daily
+
+    def update_daily(self, trades: int, pnl: float, halted: int) -> None:
+        self.daily.halted = halted
+
+    def log_fill(self, *args) -> None:
+        pass
+
+
+def _engine(ticks: int, exec_style: str) -> Engine:
+    s = Settings(
+        symbol_spot="BTCUSDT",
+        pair_a="ETHUSDT",
+        pair_b="SOLUSDT",
+        db_path=":memory:",
+        exec_style=exec_style,
+        max_trades_per_day=10**9,
+        halt_on_vol_spike=0,
+        max_daily_loss_pct=1e9,
+        daily_take_profit_pct=1e9,
+        trend_fast=5,
+        trend_slow=20,
+        pair_lookback=30,
+        pair_universe_path="",
+    )
+    eng = Engine(s)
+    eng.pub = _Feed((s.symbol_spot, s.pair_a, s.pair_b), ticks)
+    eng.store = _NullStore()
+    return eng
+
+
+def run(ticks: int = 20_000, warmup: int = 1_000, exec_style: str = "market") -> dict:
+    eng = _engine(ticks + warmup, exec_style)
+    for _ in range(warmup):
+        eng.tick()
+
+    pauses = []
+    t_gc = [0.0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            t_gc[0] = time.perf_counter()
+        else:
+            pauses.append(time.perf_counter() - t_gc[0])
+
+    gc.collect()
+    before = [g["collections"] for g in gc.get_stats()]
+    gc.callbacks.append(on_gc)
+    try:
+        t0 = time.perf_counter_ns()
+        for _ in range(ticks):
+            eng.tick()
+        elapsed = time.perf_counter_ns() - t0
+    finally:
+        gc.callbacks.remove(on_gc)
+    after = [g["collections"] for g in gc.get_stats()]
+
+    n = min(ticks, 5_000)
+    transient = 0
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    peak = base
+    for _ in range(n):
+        live, tick_peak = tracemalloc.get_traced_memory()
+        peak = max(peak, tick_peak)
+        tracemalloc.reset_peak()
+        eng.tick()
+        _, tick_peak = tracemalloc.get_traced_memory()
+        transient += tick_peak - live
+    cur, tick_peak = tracemalloc.get_traced_memory()
+    peak = max(peak, tick_peak)
+    tracemalloc.stop()
+
+    return {
+        "ticks": ticks,
+        "ns_per_tick": elapsed / ticks,
+        "gc": [a - b for a, b in zip(after, before)],
+        "gc_pause_ms": sum(pauses) * 1000.0,
+        "gc_max_pause_ms": max(pauses, default=0.0) * 1000.0,
+        "alloc_peak_kb": (peak - base) / 1024.0,
+        "alloc_net_kb": (cur - base) / 1024.0,
+        "tick_transient_b": transient / n,
+    }
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark Engine.tick() on a synthetic feed.")
+    ap.add_argument("--ticks", type=int, default=20_000)
+    ap.add_argument("--warmup", type=int, default=1_000)
+    ap.add_argument("--exec-style", default="market", help="market | twap | iceberg")
+    ap.add_argument("--log-sample", default="", help='e.g. "tick=10"; default: logging at ERROR only')
+    args = ap.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull:
+        if args.log_sample:
+            with contextlib.redirect_stdout(devnull):  # the stdout sink binds to devnull
+                setup_logging("INFO", sample=args.log_sample)
+        else:
+            logging.getLogger().setLevel(logging.ERROR)
+        try:
+            r = run(args.ticks, args.warmup, args.exec_style)
+        finally:
+            shutdown_logging()
+    print(f"ticks={r['ticks']} exec_style={args.exec_style} log_sample={args.log_sample or '-'}")
+    print(f"  {r['ns_per_tick'] / 1000.0:.1f} us/tick")
+    print(f"  gc collections gen0/1/2 = {r['gc'][0]}/{r['gc'][1]}/{r['gc'][2]}")
+    print(f"  gc pause total={r['gc_pause_ms']:.2f} ms max={r['gc_max_pause_ms']:.3f} ms")
+    print(f"  tracemalloc peak={r['alloc_peak_kb']:.1f} KiB net={r['alloc_net_kb']:.1f} KiB")
+    print(f"  per-tick transient peak={r['tick_transient_b']:.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Position ledger keyed by (strategy, symbol).
+
+Positions live in flat NumPy arrays addressed through an index map, so
+mark-to-market, unrealized PnL and exposure are a handful of vector ops no
+matter how many positions are open. Quantities are signed (short < 0) and
+use average-cost accounting.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+class PositionLedger:
+    def __init__(self, capacity: int = 64) -> None:
+        self.slots: Dict[Tuple[str, str], int] = {}
+        self.symbols: Dict[str, int] = {}
+        self.strategies: Dict[str, int] = {}
+
+        self.qty = np.zeros(capacity)
+        self.avg = np.zeros(capacity)
+        self.realized = np.zeros(capacity)
+        self.sym_of = np.zeros(capacity, dtype=np.int64)
+        self.strat_of = np.zeros(capacity, dtype=np.int64)
+        self.px = np.zeros(capacity)  # last mark per symbol id
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def _grow(self) -> None:
+        n = len(self.qty) * 2
+        for name in ("qty", "avg", "realized", "sym_of", "strat_of"):
+            a = getattr(self, name)
+            b = np.zeros(n, dtype=a.dtype)
+            b[: len(a)] = a
+            setattr(self, name, b)
+
+    def _sym(self, symbol: str) -> int:
+        i = self.symbols.get(symbol)
+        if i is None:
+            i = self.symbols[symbol] = len(self.symbols)
+            if i >= len(self.px):
+                px = np.zeros(len(self.px) * 2)
+                px[: len(self.px)] = self.px
+                self.px = px
+        return i
+
+    def slot(self, strategy: str, symbol: str) -> int:
+        key = (strategy, symbol)
+        i = self.slots.get(key)
+        if i is not None:
+            return i
+        i = len(self.slots)
+        if i >= len(self.qty):
+            self._grow()
+        self.slots[key] = i
+        self.sym_of[i] = self._sym(symbol)
+        self.strat_of[i] = self.strategies.setdefault(strategy, len(self.strategies))
+        return i
+
+    def position(self, strategy: str, symbol: str) -> Tuple[float, float]:
+        """(signed qty, avg price); (0, 0) if never traded."""
+        i = self.slots.get((strategy, symbol))
+        if i is None:
+            return 0.0, 0.0
+        return float(self.qty[i]), float(self.avg[i])
+
+    def apply(self, slot: int, signed_qty: float, price: float, fee: float) -> float:
+        """Book a fill (buy > 0, sell < 0). Returns realized PnL net of fee."""
+        q0 = float(self.qty[slot])
+        avg = float(self.avg[slot])
+        pnl = -fee
+
+        if q0 == 0.0 or (q0 > 0) == (signed_qty > 0):
+            q1 = q0 + signed_qty
+            self.avg[slot] = (avg * abs(q0) + price * abs(signed_qty)) / abs(q1) if q1 else 0.0
+        else:
+            close = min(abs(signed_qty), abs(q0))
+            pnl += (price - avg) * close * (1.0 if q0 > 0 else -1.0)
+            q1 = q0 + signed_qty
+            if q1 == 0.0:
+                self.avg[slot] = 0.0
+            elif (q1 > 0) != (q0 > 0):
+                # flipped through zero: remainder opens at the fill price
+                self.avg[slot] = price
+
+        self.qty[slot] = q1
+        self.realized[slot] += pnl
+        return pnl
+
+    # ----- vectorized views -----
+
+    def mark(self, symbol: str, price: float) -> None:
+        self.px[self._sym(symbol)] = price
+
+    def mark_many(self, prices: Dict[str, float]) -> None:
+        for sym, p in prices.items():
+            self.px[self._sym(sym)] = p
+
+    def _marks(self) -> np.ndarray:
+        n = len(self.slots)
+        return self.px[self.sym_of[:n]]
+
+    def unrealized(self) -> np.ndarray:
+        """Per-slot unrealized PnL at the last marks."""
+        n = len(self.slots)
+        return self.qty[:n] * (self._marks() - self.avg[:n])
+
+    def exposure(self) -> np.ndarray:
+        """Per-slot gross notional at the last marks."""
+        n = len(self.slots)
+        return np.abs(self.qty[:n]) * self._marks()
+
+    def by_strategy(self, values: np.ndarray) -> Dict[str, float]:
+        sums = np.bincount(self.strat_of[: len(values)], weights=values, minlength=len(self.strategies))
+        return {name: float(sums[i]) for name, i in self.strategies.items()}
@@ -14,16 +14,10 @@ import hmac
 import hashlib
 import requests
 from urllib.parse import urlencode
-from dataclasses import dataclass
+from typing import Callable, Dict, Optional
 
-
-@dataclass
-class LiveFill:
-    order_id: int
-    status: str
-    side: str
-    qty: float
-    price: float
+from .ledger import PositionLedger
+from .orders import LiveFill, VenueError
 
 
 class RateLimiter:
@@ -39,13 +33,57 @@ class RateLimiter:
         self.last = time.time()
 
 
+def _json(r: requests.Response) -> dict:
+    """Body of a successful response; a Binance error payload raises VenueError."""
+    if 400 <= r.status_code < 500 and r.status_code != 429:
+        try:
+            j = r.json()
+        except ValueError:
+            j = {}
+        if "code" in j:
+            raise VenueError(int(j["code"]), j.get("msg", ""))
+    r.raise_for_status()
+    return r.json()
+
+
 class BinanceSpotLive:
     BASE = "https://api.binance.com"
+    TIMEOUT_S = 5.0
 
-    def __init__(self, api_key: str, api_secret: str, rps: float = 8.0) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        rps: float = 8.0,
+        fee_bps: float = 10.0,
+        ledger: Optional[PositionLedger] = None,
+        base: str = "",
+    ) -> None:
+        if base:
+            self.BASE = base.rstrip("/")
         self.api_key = api_key
         self.api_secret = api_secret.encode()
         self.rl = RateLimiter(rps=rps)
+        self.fee_bps = fee_bps
+        self.ledger = ledger if ledger is not None else PositionLedger()
+        self._booked: Dict[str, tuple[str, float, float]] = {}  # cid -> (strategy, executed, quote) booked
+        # (endpoint, ms) per order request, failed ones included; the engine points it at its breaker
+        self.on_latency: Optional[Callable[[str, float], None]] = None
+
+    def _book(self, symbol: str, side: str, client_order_id: str, j: dict) -> None:
+        """Book only the newly executed part of an order into the ledger."""
+        strategy, done, quote_done = self._booked.get(client_order_id, ("", 0.0, 0.0))
+        executed = float(j.get("executedQty", 0.0))
+        delta = executed - done
+        if delta <= 0:
+            return
+        quote = float(j.get("cummulativeQuoteQty", 0.0))
+        # price the delta from the quote it added, not the order's running average
+        px = (quote - quote_done) / delta if quote > quote_done else float(j.get("price", 0.0))
+        fee = delta * px * (self.fee_bps / 10_000.0)
+        signed = delta if side.upper() == "BUY" else -delta
+        self.ledger.apply(self.ledger.slot(strategy, symbol), signed, px, fee)
+        self._booked[client_order_id] = (strategy, executed, quote)
 
     def _sign(self, params: dict) -> dict:
         qs = urlencode(params, doseq=True)
@@ -56,8 +94,29 @@ class BinanceSpotLive:
     def _headers(self) -> dict:
         return {"X-MBX-APIKEY": self.api_key}
 
-    def place_limit(self, symbol: str, side: str, qty: float, price: float, client_order_id: str) -> LiveFill:
+    def _order(self, method: str, endpoint: str, params: dict) -> dict:
+        """Signed /api/v3/order call, timed into on_latency whether or not it succeeds."""
+        t0 = time.perf_counter()
+        try:
+            r = requests.request(
+                method, f"{self.BASE}/api/v3/order", headers=self._headers(), params=self._sign(params), timeout=self.TIMEOUT_S
+            )
+        finally:
+            if self.on_latency is not None:
+                self.on_latency(endpoint, (time.perf_counter() - t0) * 1000.0)
+        return _json(r)
+
+    def place_limit(
+        self,
+        symbol: str,
+        side: str,
+        qty: float,
+        price: float,
+        client_order_id: str,
+        strategy: str = "",
+    ) -> LiveFill:
         self.rl.wait()
+        self._booked.setdefault(client_order_id, (strategy, 0.0, 0.0))
         params = {
             "symbol": symbol,
             "side": side.upper(),
@@ -68,22 +127,41 @@ class BinanceSpotLive:
             "newClientOrderId": client_order_id,
             "timestamp": int(time.time() * 1000),
         }
-        signed = self._sign(params)
-        r = requests.post(f"{self.BASE}/api/v3/order", headers=self._headers(), params=signed, timeout=5)
-        r.raise_for_status()
-        j = r.json()
+        j = self._order("POST", "order/place", params)
+        self._book(symbol, side, client_order_id, j)
+        return self._fill(j, side, qty, price)
+
+    @staticmethod
+    def _fill(j: dict, side: str, qty: float, price: float) -> LiveFill:
+        executed = float(j.get("executedQty", 0.0))
+        quote = float(j.get("cummulativeQuoteQty", 0.0))
         return LiveFill(
             order_id=int(j["orderId"]),
             status=j["status"],
             side=side,
             qty=float(qty),
             price=float(price),
+            executed_qty=executed,
+            avg_price=quote / executed if executed > 0 else 0.0,
         )
 
+    def order_status(self, symbol: str, client_order_id: str) -> LiveFill:
+        self.rl.wait()
+        params = {"symbol": symbol, "origClientOrderId": client_order_id, "timestamp": int(time.time() * 1000)}
+        j = self._order("GET", "order/status", params)
+        self._book(symbol, j["side"], client_order_id, j)
+        return self._fill(j, j["side"].lower(), float(j["origQty"]), float(j["price"]))
+
+    def mark(self, symbol: str, price: float) -> None:
+        self.ledger.mark(symbol, price)
+
     def cancel(self, symbol: str, client_order_id: str) -> dict:
         self.rl.wait()
         params = {"symbol": symbol, "origClientOrderId": client_order_id, "timestamp": int(time.time() * 1000)}
-        signed = self._sign(params)
-        r = requests.delete(f"{self.BASE}/api/v3/order", headers=self._headers(), params=signed, timeout=5)
-        r.raise_for_status()
-        return r.json()
+        j = self._order("DELETE", "order/cancel", params)
+        self._book(symbol, j.get("side", ""), client_order_id, j)
+        return j
+
+    def forget(self, symbol: str, client_order_id: str) -> None:
+        """Drop the booking record of a closed order the caller has settled."""
+        self._booked.pop(client_order_id, None)
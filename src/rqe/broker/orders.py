@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+OPEN = ("NEW", "PARTIALLY_FILLED")
+
+# Binance error codes the scheduler acts on
+NEW_ORDER_REJECTED = -2010  # generic place reject; "Duplicate order sent." when the id is still open
+UNKNOWN_CANCEL = -2011
+UNKNOWN_ORDER = -2013  # no order under that id: it never reached the venue
+
+
+class VenueError(Exception):
+    """The venue answered and rejected the request (as opposed to a timeout, where the outcome is unknown)."""
+
+    def __init__(self, code: int, msg: str = "") -> None:
+        super().__init__(f"{code} {msg}".strip())
+        self.code = code
+        self.msg = msg
+
+
+@dataclass
+class LiveFill:
+    order_id: int
+    status: str
+    side: str
+    qty: float
+    price: float
+    executed_qty: float = 0.0
+    avg_price: float = 0.0
+
+
+def client_order_id(parent_id: str, child: int, rev: int = 0) -> str:
+    """
+    Deterministic id per (parent, child slice, replace revision).
+
+    Re-sending after a timeout reuses the same id, so the exchange rejects the
+    duplicate instead of opening a second order. That only holds while the
+    first order is open: once it is FILLED or CANCELED the venue accepts the id
+    again, so only resend after the venue reports UNKNOWN_ORDER.
+    Binance caps ids at 36 chars.
+    """
+    return f"rqe-{parent_id}-{child}-{rev}"[:36]
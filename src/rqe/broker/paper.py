@@ -1,57 +1,167 @@
-from dataclasses import dataclass
+from typing import Dict, Optional
+
+from ..signals import Action, LABELS
+from .ledger import PositionLedger
+from .orders import NEW_ORDER_REJECTED, OPEN, UNKNOWN_CANCEL, UNKNOWN_ORDER, LiveFill, VenueError
 
 
-@dataclass
 class Fill:
-    side: str
-    qty: float
-    price: float
-    fee: float
-    pnl: float
-    slippage_bps: float
+    __slots__ = ("side", "qty", "price", "fee", "pnl", "slippage_bps")
+
+    def __init__(
+        self,
+        side: Action = Action.FLAT,
+        qty: float = 0.0,
+        price: float = 0.0,
+        fee: float = 0.0,
+        pnl: float = 0.0,
+        slippage_bps: float = 0.0,
+    ) -> None:
+        self.side = side  # BUY | SELL | FLAT
+        self.qty = qty
+        self.price = price
+        self.fee = fee
+        self.pnl = pnl
+        self.slippage_bps = slippage_bps
+
+    def __repr__(self) -> str:
+        return f"Fill({LABELS[self.side]}, qty={self.qty}, price={self.price}, fee={self.fee}, pnl={self.pnl})"
 
 
 class PaperBroker:
-    def __init__(self, fee_bps: float = 10.0) -> None:
+    """Simulated fills booked into a (strategy, symbol) ledger so strategies never share inventory."""
+
+    def __init__(self, fee_bps: float = 10.0, ledger: Optional[PositionLedger] = None) -> None:
         self.fee_bps = fee_bps
-        self.pos_qty = 0.0
-        self.avg = 0.0
-        self.realized = 0.0
+        self.ledger = ledger if ledger is not None else PositionLedger()
+        self.last: Dict[str, float] = {}
+        self.orders: Dict[str, dict] = {}  # client_order_id -> order state, until forget()
+        self.resting: Dict[str, dict] = {}  # open subset of orders
+        self._next_id = 1
+        self.fill = Fill()  # reused by buy/sell/flatten
+
+    def _emit(self, side: Action, qty: float, price: float, fee: float, pnl: float, slip_bps: float) -> Fill:
+        f = self.fill
+        f.side = side
+        f.qty = qty
+        f.price = price
+        f.fee = fee
+        f.pnl = pnl
+        f.slippage_bps = slip_bps
+        return f
+
+    @property
+    def realized(self) -> float:
+        return float(self.ledger.realized[: len(self.ledger)].sum())
 
     def _fee(self, notional: float) -> float:
         return notional * (self.fee_bps / 10_000.0)
 
-    def buy(self, qty: float, price: float, slip_bps: float = 5.0) -> Fill:
+    def buy(self, qty: float, price: float, slip_bps: float = 5.0, strategy: str = "", symbol: str = "") -> Fill:
         fill_px = price * (1 + slip_bps / 10_000.0)
-        notional = qty * fill_px
-        fee = self._fee(notional)
+        fee = self._fee(qty * fill_px)
+        pnl = self.ledger.apply(self.ledger.slot(strategy, symbol), qty, fill_px, fee)
+        return self._emit(Action.BUY, qty, fill_px, fee, pnl, slip_bps)
 
-        new_qty = self.pos_qty + qty
-        self.avg = ((self.avg * self.pos_qty) + (fill_px * qty)) / new_qty if new_qty else 0.0
-        self.pos_qty = new_qty
+    def sell(self, qty: float, price: float, slip_bps: float = 5.0, strategy: str = "", symbol: str = "") -> Fill:
+        fill_px = price * (1 - slip_bps / 10_000.0)
+        fee = self._fee(qty * fill_px)
+        pnl = self.ledger.apply(self.ledger.slot(strategy, symbol), -qty, fill_px, fee)
+        return self._emit(Action.SELL, qty, fill_px, fee, pnl, slip_bps)
 
-        return Fill("buy", qty, fill_px, fee, 0.0, slip_bps)
+    def flatten(self, price: float, strategy: str = "", symbol: str = "") -> Fill:
+        qty, _ = self.ledger.position(strategy, symbol)
+        if qty > 0:
+            return self.sell(qty, price, slip_bps=10.0, strategy=strategy, symbol=symbol)
+        if qty < 0:
+            return self.buy(-qty, price, slip_bps=10.0, strategy=strategy, symbol=symbol)
+        return self._emit(Action.FLAT, 0.0, price, 0.0, 0.0, 0.0)
 
-    def sell(self, qty: float, price: float, slip_bps: float = 5.0) -> Fill:
-        fill_px = price * (1 - slip_bps / 10_000.0)
-        notional = qty * fill_px
-        fee = self._fee(notional)
-
-        pnl = 0.0
-        if self.pos_qty > 0:
-            close = min(qty, self.pos_qty)
-            pnl = (fill_px - self.avg) * close - fee
-            self.pos_qty -= close
-            if self.pos_qty == 0:
-                self.avg = 0.0
-            self.realized += pnl
-        else:
-            pnl = -fee
-            self.realized += pnl
-
-        return Fill("sell", qty, fill_px, fee, pnl, slip_bps)
-
-    def flatten(self, price: float) -> Fill:
-        if self.pos_qty > 0:
-            return self.sell(self.pos_qty, price, slip_bps=10.0)
-        return Fill("flat", 0.0, price, 0.0, 0.0, 0.0)
+    # ----- limit orders (same surface as BinanceSpotLive) -----
+
+    def _match(self, o: dict, px: float) -> None:
+        crosses = px <= o["price"] if o["side"] == "buy" else px >= o["price"]
+        if o["status"] not in OPEN or not crosses:
+            return
+        qty = o["qty"] - o["executed"]
+        # marketable on arrival trades at the mark, resting orders at their limit
+        fill_px = px if o["arrival"] else o["price"]
+        fee = self._fee(qty * fill_px)
+        signed = qty if o["side"] == "buy" else -qty
+        self.ledger.apply(self.ledger.slot(o["strategy"], o["symbol"]), signed, fill_px, fee)
+        o["executed"] += qty
+        o["quote"] += qty * fill_px
+        o["status"] = "FILLED"
+
+    def _ack(self, o: dict) -> LiveFill:
+        ex = o["executed"]
+        return LiveFill(o["order_id"], o["status"], o["side"], o["qty"], o["price"], ex, o["quote"] / ex if ex else 0.0)
+
+    def mark(self, symbol: str, price: float) -> None:
+        """New market price: update marks and fill resting orders it crosses."""
+        self.last[symbol] = price
+        self.ledger.mark(symbol, price)
+        for cid, o in list(self.resting.items()):
+            if o["symbol"] == symbol:
+                o["arrival"] = False
+                self._match(o, price)
+                if o["status"] not in OPEN:
+                    del self.resting[cid]
+
+    def place_limit(
+        self,
+        symbol: str,
+        side: str,
+        qty: float,
+        price: float,
+        client_order_id: str,
+        strategy: str = "",
+    ) -> LiveFill:
+        o = self.orders.get(client_order_id)
+        # venue rule: an id is rejected while its order is open, reusable once it is closed
+        if o is not None and o["status"] in OPEN:
+            raise VenueError(NEW_ORDER_REJECTED, "Duplicate order sent.")
+        o = self.orders[client_order_id] = {
+            "order_id": self._next_id,
+            "symbol": symbol,
+            "side": side.lower(),
+            "qty": qty,
+            "price": price,
+            "strategy": strategy,
+            "executed": 0.0,
+            "quote": 0.0,
+            "status": "NEW",
+            "arrival": True,
+        }
+        self._next_id += 1
+        if symbol in self.last:
+            self._match(o, self.last[symbol])
+        if o["status"] in OPEN:
+            self.resting[client_order_id] = o
+        return self._ack(o)
+
+    def order_status(self, symbol: str, client_order_id: str) -> LiveFill:
+        o = self.orders.get(client_order_id)
+        if o is None:
+            raise VenueError(UNKNOWN_ORDER, "Order does not exist.")
+        return self._ack(o)
+
+    def cancel(self, symbol: str, client_order_id: str) -> dict:
+        o = self.orders.get(client_order_id)
+        if o is None or o["status"] not in OPEN:
+            raise VenueError(UNKNOWN_CANCEL, "Unknown order sent.")
+        o["status"] = "CANCELED"
+        self.resting.pop(client_order_id, None)
+        return {
+            "orderId": o["order_id"],
+            "status": o["status"],
+            "side": o["side"].upper(),
+            "executedQty": o["executed"],
+            "cummulativeQuoteQty": o["quote"],
+        }
+
+    def forget(self, symbol: str, client_order_id: str) -> None:
+        """Drop a closed order once the caller has settled it; open orders are kept."""
+        o = self.orders.get(client_order_id)
+        if o is not None and o["status"] not in OPEN:
+            del self.orders[client_order_id]
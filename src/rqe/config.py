@@ -1,48 +1,88 @@
 import os
-from pydantic import BaseModel
+from dataclasses import dataclass, fields
+from typing import Mapping, Optional
 
+# fields whose env var is not just the upper-cased field name
+_ENV_KEYS = {"exchange_base_url": "BINANCE_BASE_URL"}
 
-def _s(k: str, d: str) -> str:
-    return os.getenv(k, d)
 
+@dataclass
+class Settings:
+    """
+    Engine configuration. Defaults live here; `from_env` overlays the
+    environment once, when the engine is built, not when this module is imported.
+    """
 
-class Settings(BaseModel):
-    mode: str = _s("MODE", "paper")
+    mode: str = "paper"
 
-    binance_api_key: str = _s("BINANCE_API_KEY", "")
-    binance_api_secret: str = _s("BINANCE_API_SECRET", "")
+    binance_api_key: str = ""
+    binance_api_secret: str = ""
 
-    symbol_spot: str = _s("SYMBOL_SPOT", "BTCUSDT")
-    symbol_perp: str = _s("SYMBOL_PERP", "BTCUSDT")
+    exchange_base_url: str = ""  # empty = api.binance.com; point at rqe.mockex offline
 
-    max_notional_usd: float = float(_s("MAX_NOTIONAL_USD", "100"))
-    max_daily_loss_pct: float = float(_s("MAX_DAILY_LOSS_PCT", "0.02"))
-    daily_take_profit_pct: float = float(_s("DAILY_TAKE_PROFIT_PCT", "0.03"))
-    max_trades_per_day: int = int(_s("MAX_TRADES_PER_DAY", "20"))
-    max_slippage_bps: float = float(_s("MAX_SLIPPAGE_BPS", "15"))
-    max_api_latency_ms: int = int(_s("MAX_API_LATENCY_MS", "800"))
-    halt_on_vol_spike: int = int(_s("HALT_ON_VOL_SPIKE", "1"))
-    vol_spike_mult: float = float(_s("VOL_SPIKE_MULT", "3.0"))
+    symbol_spot: str = "BTCUSDT"
+    symbol_perp: str = "BTCUSDT"
 
-    w_trend: float = float(_s("W_TREND", "0.35"))
-    w_pairs: float = float(_s("W_PAIRS", "0.35"))
-    w_funding: float = float(_s("W_FUNDING", "0.30"))
+    max_notional_usd: float = 100.0
+    max_daily_loss_pct: float = 0.02
+    daily_take_profit_pct: float = 0.03
+    max_trades_per_day: int = 20
+    max_slippage_bps: float = 15.0
+    max_api_latency_ms: int = 800
+    breaker_window: int = 300
+    breaker_degrade_at: float = 0.75
+    breaker_recover_ticks: int = 30
+    breaker_stale_ticks: int = 300
+    halt_on_vol_spike: int = 1
+    vol_spike_mult: float = 3.0
 
-    trend_fast: int = int(_s("TREND_FAST", "50"))
-    trend_slow: int = int(_s("TREND_SLOW", "200"))
-    trend_vol_target_pct: float = float(_s("TREND_VOL_TARGET_PCT", "0.007"))
+    w_trend: float = 0.35
+    w_pairs: float = 0.35
+    w_funding: float = 0.30
+    portfolio_method: str = "static"  # static | vol_target | risk_parity
+    portfolio_ewma_lambda: float = 0.97
+    portfolio_resolve_tol: float = 0.05
 
-    pair_a: str = _s("PAIR_A", "BTCUSDT")
-    pair_b: str = _s("PAIR_B", "ETHUSDT")
-    pair_lookback: int = int(_s("PAIR_LOOKBACK", "240"))
-    pair_z_enter: float = float(_s("PAIR_Z_ENTER", "2.2"))
-    pair_z_exit: float = float(_s("PAIR_Z_EXIT", "0.7"))
-    pair_max_hold_min: int = int(_s("PAIR_MAX_HOLD_MIN", "240"))
+    trend_fast: int = 50
+    trend_slow: int = 200
+    trend_vol_target_pct: float = 0.007
 
-    funding_min: float = float(_s("FUNDING_MIN", "0.0005"))
-    funding_hold_hrs: int = int(_s("FUNDING_HOLD_HRS", "8"))
+    pair_a: str = "BTCUSDT"
+    pair_b: str = "ETHUSDT"
+    pair_lookback: int = 240
+    pair_z_enter: float = 2.2
+    pair_z_exit: float = 0.7
+    pair_max_hold_min: int = 240
+    pair_hedge: str = "rls"  # fixed | rls
+    pair_rls_lambda: float = 0.999
+    pair_universe_path: str = ""  # ranked output of rqe.scanner
 
-    loop_seconds: float = float(_s("LOOP_SECONDS", "2"))
-    log_level: str = _s("LOG_LEVEL", "INFO")
-    db_path: str = _s("DB_PATH", "./rqe.sqlite")
-    metrics_port: int = int(_s("METRICS_PORT", "9108"))
+    funding_min: float = 0.0005
+    funding_hold_hrs: int = 8
+
+    exec_style: str = "market"  # market | twap | iceberg
+    exec_slices: int = 5
+    exec_interval_s: float = 10.0
+    exec_chase_s: float = 4.0
+    exec_passive_bps: float = 2.0
+    exec_chase_step_bps: float = 2.0
+
+    loop_seconds: float = 2.0
+    log_level: str = "INFO"
+    log_file: str = ""  # JSON lines, size-rotated; stdout always
+    log_max_bytes: int = 10_000_000
+    log_backups: int = 5
+    log_sample: str = "tick=10"  # keep 1 in N per message kind
+    db_path: str = "./rqe.sqlite"
+    metrics_port: int = 9108
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None, **overrides) -> "Settings":
+        env = os.environ if env is None else env
+        kw = {}
+        for f in fields(cls):
+            raw = env.get(_ENV_KEYS.get(f.name, f.name.upper()))
+            if raw is not None:
+                kw[f.name] = f.type(raw)
+        kw.update(overrides)
+        return cls(**kw)
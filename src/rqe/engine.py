@@ -1,25 +1,26 @@
+import math
+import sys
 import time
 import logging
-from dataclasses import dataclass
-from collections import deque
+from typing import Optional
+from dataclasses import dataclass, field
 
-from rich.console import Console
+import numpy as np
+import requests
 
 from .config import Settings
-from .log import setup as setup_logging
+from .log import sample as log_sample, setup as setup_logging
 from .storage import Store
-from .metrics import start as start_metrics, TRADES, HALTS, PNL, SLIP, STATE
-from .exchange.binance_public import BinancePublic
-from .risk import RiskManager, RiskCfg, RiskState
+from .metrics import start as start_metrics, TRADES, HALTS, PNL, SLIP, STATE, UNREAL, EXPOSURE, QUANTILE, BREAKER
+from .exchange.binance_public import BinancePublic, Ticker
+from .risk import RiskManager, RiskCfg, RiskState, BREAKER_TRIPPED
 from .validate import Validator
-from .portfolio import Weights, allocate
+from .signals import Action, LABELS
+from .sketch import RollingMoments
+from .portfolio import RiskAllocator, TREND, PAIRS
 from .broker.paper import PaperBroker
-from .strategies.trend import TrendFollowing
-from .strategies.pairs import PairsMeanReversion
-from .strategies.funding import FundingCarry
 
 log = logging.getLogger("rqe.engine")
-console = Console()
 
 
 @dataclass
@@ -27,52 +28,196 @@ class Runtime:
     equity_usd: float = 1000.0  # paper equity baseline (edit later)
     halted: bool = False
     vol_baseline: float = 0.0
-    returns_window: deque = deque(maxlen=240)
+    returns_window: RollingMoments = field(default_factory=lambda: RollingMoments(240))
     last_price: float = 0.0
-
-
-def _realized_vol(returns):
+    breaker_state: int = 0
+    last_log_a: float = 0.0
+    last_log_b: float = 0.0
+    sleeve_returns: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    # reused every tick so the steady-state loop allocates as little as possible
+    t_spot: Ticker = field(default_factory=Ticker)
+    t_a: Ticker = field(default_factory=Ticker)
+    t_b: Ticker = field(default_factory=Ticker)
+    risk_state: RiskState = field(default_factory=RiskState)
+    prices: dict = field(default_factory=dict)
+    quantile_gauges: dict = field(default_factory=dict)  # (kind, endpoint) -> QUANTILE child
+
+
+def _realized_vol(returns: RollingMoments) -> float:
     if len(returns) < 30:
         return 0.0
-    m = sum(returns) / len(returns)
-    v = sum((x - m) ** 2 for x in returns) / max(1, len(returns) - 1)
-    return v**0.5
-
-
-def run() -> None:
-    s = Settings()
-
-    setup_logging(s.log_level)
-    start_metrics(s.metrics_port)
-
-    store = Store(s.db_path)
-    pub = BinancePublic()
-
-    risk = RiskManager(
-        RiskCfg(
-            max_notional_usd=s.max_notional_usd,
-            max_daily_loss_pct=s.max_daily_loss_pct,
-            daily_take_profit_pct=s.daily_take_profit_pct,
-            max_trades_per_day=s.max_trades_per_day,
-            max_slippage_bps=s.max_slippage_bps,
-            max_api_latency_ms=s.max_api_latency_ms,
-            halt_on_vol_spike=bool(s.halt_on_vol_spike),
-            vol_spike_mult=s.vol_spike_mult,
-        )
-    )
-
-    validator = Validator(vol_spike_mult=s.vol_spike_mult)
+    return returns.std()
 
-    trend = TrendFollowing(s.trend_fast, s.trend_slow)
-    pairs = PairsMeanReversion(s.pair_lookback, s.pair_z_enter, s.pair_z_exit, s.pair_max_hold_min)
-    funding = FundingCarry(s.funding_min, s.funding_hold_hrs)
 
-    broker = PaperBroker()  # default (paper)
-    rt = Runtime()
+def _record_child_fills(store: Store, mode: str, daily, fills, prices, risk: RiskManager) -> None:
+    for cf in fills:
+        po = cf.parent
+        mid = cf.mid or prices[po.symbol]  # vs the child's arrival mid, not the mid after the market moved through it
+        slip = (cf.price / mid - 1.0) * 10_000.0 * (1.0 if po.side == "buy" else -1.0)
+        SLIP.set(slip)
+        risk.breaker.observe_slippage(po.symbol, slip)
+        store.log_fill(
+            mode,
+            po.strategy,
+            po.symbol,
+            po.side,
+            cf.qty,
+            cf.price,
+            cf.fee,
+            cf.pnl,
+            "parent=%s child=%d rev=%d left=%.8f",
+            po.parent_id,
+            po.child,
+            po.rev,
+            po.remaining,
+        )
+        daily.realized_pnl_usd += cf.pnl
+
+
+class Engine:
+    """All trading state for one engine instance; `tick()` runs one loop iteration."""
+
+    def __init__(self, s: Settings, broker=None) -> None:
+        store = Store(s.db_path)
+        pub = BinancePublic(s.exchange_base_url)
+
+        risk = RiskManager(
+            RiskCfg(
+                max_notional_usd=s.max_notional_usd,
+                max_daily_loss_pct=s.max_daily_loss_pct,
+                daily_take_profit_pct=s.daily_take_profit_pct,
+                max_trades_per_day=s.max_trades_per_day,
+                max_slippage_bps=s.max_slippage_bps,
+                max_api_latency_ms=s.max_api_latency_ms,
+                halt_on_vol_spike=bool(s.halt_on_vol_spike),
+                vol_spike_mult=s.vol_spike_mult,
+                breaker_window=s.breaker_window,
+                breaker_degrade_at=s.breaker_degrade_at,
+                breaker_recover_ticks=s.breaker_recover_ticks,
+                breaker_stale_ticks=s.breaker_stale_ticks,
+            )
+        )
 
-    console.print(f"[bold]RQE[/bold] mode={s.mode} metrics_port={s.metrics_port}")
+        validator = Validator(vol_spike_mult=s.vol_spike_mult)
+
+        # strategies (and the scanner / scheduler) are only imported when they are switched on
+        trend = pairs = funding = None
+        if s.w_trend > 0:
+            from .strategies.trend import TrendFollowing
+
+            trend = TrendFollowing(s.trend_fast, s.trend_slow)
+        if s.w_pairs > 0:
+            from .strategies.pairs import PairsMeanReversion
+
+            beta0, alpha0 = 1.0, 0.0
+            if s.pair_universe_path:
+                from .scanner import load_ranked
+
+                ranked = load_ranked(s.pair_universe_path)
+                if ranked:
+                    top = ranked[0]
+                    s.pair_a, s.pair_b, beta0, alpha0 = top.a, top.b, top.beta, top.alpha
+                else:  # the scanner found nothing cointegrated; trade the configured pair
+                    log.warning(
+                        "empty_universe",
+                        extra={"kind": "empty_universe", "path": s.pair_universe_path, "pair": f"{s.pair_a}/{s.pair_b}"},
+                    )
+            pairs = PairsMeanReversion(
+                s.pair_lookback,
+                s.pair_z_enter,
+                s.pair_z_exit,
+                s.pair_max_hold_min,
+                hedge=s.pair_hedge,
+                rls_lambda=s.pair_rls_lambda,
+                beta0=beta0,
+                alpha0=alpha0,
+            )
+        if s.w_funding > 0:
+            from .strategies.funding import FundingCarry
+
+            funding = FundingCarry(s.funding_min, s.funding_hold_hrs)
+
+        if broker is None:
+            broker = PaperBroker()  # default (paper)
+        if hasattr(broker, "on_latency"):  # a networked venue times its order endpoints into the breaker
+            broker.on_latency = risk.breaker.observe_latency
+        sched = None
+        if s.exec_style != "market":
+            from .execution import ExecutionScheduler, ExecCfg
+
+            sched = ExecutionScheduler(
+                broker,
+                ExecCfg(
+                    style=s.exec_style,
+                    slices=s.exec_slices,
+                    interval_s=s.exec_interval_s,
+                    chase_s=s.exec_chase_s,
+                    passive_bps=s.exec_passive_bps,
+                    chase_step_bps=s.exec_chase_step_bps,
+                    # chase stays well inside the breaker's degrade level so our own fills can't trip it
+                    max_cross_bps=0.5 * s.breaker_degrade_at * s.max_slippage_bps,
+                ),
+            )
+        allocator = RiskAllocator(
+            np.array([s.w_trend, s.w_pairs, s.w_funding]),
+            method=s.portfolio_method,
+            vol_targets=np.array([s.trend_vol_target_pct, 0.0, 0.0]),
+            periods_per_day=86_400.0 / max(1e-3, s.loop_seconds),
+            lam=s.portfolio_ewma_lambda,
+            tol=s.portfolio_resolve_tol,
+        )
+        rt = Runtime()
+
+        self.s = s
+        self.store = store
+        self.pub = pub
+        self.risk = risk
+        self.validator = validator
+        self.trend = trend
+        self.pairs = pairs
+        self.funding = funding
+        self.broker = broker
+        self.sched = sched
+        self.allocator = allocator
+        self.rt = rt
+
+    def _stand_down(self, daily, halted: int) -> None:
+        """Pull every working child order (halt / breaker trip) so nothing rests on the book unmanaged."""
+        sched = self.sched
+        if sched is None or not sched.parents:
+            return
+        fills = sched.cancel_all()
+        if fills:
+            _record_child_fills(self.store, self.s.mode, daily, fills, self.rt.prices, self.risk)
+            self.store.update_daily(daily.trades, daily.realized_pnl_usd, halted)
+
+    def _breaker(self, daily) -> int:
+        """Step the latency/slippage breaker, publish its quantiles and stand down on a trip."""
+        breaker, rt = self.risk.breaker, self.rt
+        bstate = breaker.update()
+        BREAKER.set(bstate)
+        gauges = rt.quantile_gauges
+        for key in breaker.dropped:  # stale sketch: its series should not linger at the last value
+            QUANTILE.remove(*key)
+            del gauges[key]
+        for key, sk in breaker.sketches.items():
+            g = gauges.get(key)
+            if g is None:  # labels() builds a tuple and takes a lock on every call; resolve once per series
+                g = gauges[key] = QUANTILE.labels(*key)
+            g.set(sk.value())
+        if bstate != rt.breaker_state:
+            log.warning("breaker", extra={"kind": "breaker", "state": bstate, "ratio": breaker.ratio})
+            rt.breaker_state = bstate
+        if bstate == BREAKER_TRIPPED:
+            self._stand_down(daily, 0)
+        return bstate
+
+    def tick(self) -> None:
+        """One pass of the trading loop: market data, gates, strategies, execution, bookkeeping."""
+        s, store, pub, risk, validator = self.s, self.store, self.pub, self.risk, self.validator
+        trend, pairs, funding = self.trend, self.pairs, self.funding
+        broker, sched, allocator, rt = self.broker, self.sched, self.allocator, self.rt
 
-    while True:
         daily = store.get_daily()
         rt.halted = bool(daily.halted)
 
@@ -80,13 +225,45 @@ def run() -> None:
         PNL.set(daily.realized_pnl_usd)
 
         # ===== Market data (public REST price; WebSocket upgrade later) =====
-        t_spot = pub.price(s.symbol_spot)
-        p = t_spot.price
-
+        try:
+            t_spot = pub.price(s.symbol_spot, out=rt.t_spot)
+            t_a = pub.price(s.pair_a, out=rt.t_a)
+            t_b = pub.price(s.pair_b, out=rt.t_b)
+        except requests.RequestException as e:
+            # no quote in time is the worst latency there is: count it at the full timeout so
+            # repeated failures trip the breaker (and pull resting children) instead of killing the loop
+            risk.breaker.observe_latency("ticker/price", BinancePublic.TIMEOUT_S * 1000.0)
+            log.warning("feed_error", extra={"kind": "feed_error", "err": str(e)})
+            self._breaker(daily)
+            return
+        p, a, b = t_spot.price, t_a.price, t_b.price
+        now = time.time()
+        broker.mark(s.symbol_spot, p)
+        broker.mark(s.pair_a, a)
+        broker.mark(s.pair_b, b)
+        prices = rt.prices  # execution mids, reused
+        prices[s.symbol_spot] = p
+        prices[s.pair_a] = a
+
+        tick_latency_ms = max(t_spot.latency_ms, t_a.latency_ms, t_b.latency_ms)
+        breaker = risk.breaker
+        breaker.observe_latency("ticker/price", t_spot.latency_ms)
+        breaker.observe_latency("ticker/price", t_a.latency_ms)
+        breaker.observe_latency("ticker/price", t_b.latency_ms)
+
+        # sleeve returns for the allocator: trend ~ spot, pairs ~ hedged spread return
+        # d(log a) - beta * d(log b) with one beta for both ends (beta drift is not a return); funding has none yet
+        la, lb = math.log(max(1e-9, a)), math.log(max(1e-9, b))
         if rt.last_price > 0:
             r = (p - rt.last_price) / rt.last_price
-            rt.returns_window.append(r)
+            rt.returns_window.push(r)
+            rt.sleeve_returns[TREND] = r
+            beta = pairs.beta if pairs is not None else 1.0
+            rt.sleeve_returns[PAIRS] = (la - rt.last_log_a) - beta * (lb - rt.last_log_b)
+            allocator.update(rt.sleeve_returns)
         rt.last_price = p
+        rt.last_log_a = la
+        rt.last_log_b = lb
 
         # volatility model (shock detection)
         vol_now = _realized_vol(rt.returns_window)
@@ -96,48 +273,67 @@ def run() -> None:
             rt.vol_baseline = 0.98 * rt.vol_baseline + 0.02 * vol_now
 
         # risk state
-        st = RiskState(
-            equity_usd=rt.equity_usd,
-            trades_today=daily.trades,
-            realized_pnl_usd=daily.realized_pnl_usd,
-            halted=rt.halted,
-        )
+        st = rt.risk_state
+        st.equity_usd = rt.equity_usd
+        st.trades_today = daily.trades
+        st.realized_pnl_usd = daily.realized_pnl_usd
+        st.halted = rt.halted
 
         ok, reason = risk.daily_limits_ok(st)
         if not ok:
+            self._stand_down(daily, 1)
             if not rt.halted:
                 HALTS.labels(reason=reason).inc()
                 store.update_daily(daily.trades, daily.realized_pnl_usd, 1)
-                console.print(f"[red]HALT[/red] reason={reason}")
-            time.sleep(s.loop_seconds)
-            continue
+                log.warning("halt", extra={"kind": "halt", "reason": reason})
+            return
 
         # volatility shock gate
         vres = validator.vol_spike(vol_now, rt.vol_baseline)
         if (not vres.ok) and risk.cfg.halt_on_vol_spike:
+            self._stand_down(daily, 1)
             HALTS.labels(reason=vres.reason).inc()
             store.update_daily(daily.trades, daily.realized_pnl_usd, 1)
-            console.print(
-                f"[red]HALT[/red] reason={vres.reason} vol_now={vol_now:.6f} base={rt.vol_baseline:.6f}"
+            log.warning(
+                "halt",
+                extra={"kind": "halt", "reason": vres.reason, "vol_now": vol_now, "vol_base": rt.vol_baseline},
             )
-            time.sleep(s.loop_seconds)
-            continue
+            return
+
+        # ===== Latency / slippage breaker =====
+        if self._breaker(daily) == BREAKER_TRIPPED:
+            return
+        if tick_latency_ms > s.max_api_latency_ms:
+            # quotes are stale by the time they arrived; don't trade on them
+            log.warning("stale_tick", extra={"kind": "stale_tick", "latency_ms": tick_latency_ms})
+            return
 
         # ===== Portfolio allocation =====
-        alloc = allocate(
-            risk.cap_notional(s.max_notional_usd),
-            Weights(s.w_trend, s.w_pairs, s.w_funding),
-        ).by_strategy_usd
+        alloc = allocator.allocate(risk.cap_notional(s.max_notional_usd))
 
         # ===== Strategy 1: Trend (trade spot) =====
-        tsig = trend.on_price(p)
-        if tsig.action in ("buy", "flat"):
+        tsig = trend.on_price(p) if trend is not None else None
+        t_act = tsig.action if tsig is not None else Action.HOLD
+        if t_act is Action.BUY or t_act is Action.FLAT:
             slip_bps = min(10.0, risk.cfg.max_slippage_bps)
-            usd = alloc["trend"]
+            usd = float(alloc[TREND])
             qty = usd / p if usd > 0 else 0.0
 
-            if tsig.action == "buy" and qty > 0:
-                fill = broker.buy(qty, p, slip_bps=slip_bps)
+            if sched is not None:
+                if t_act is Action.BUY and qty > 0:
+                    fills = sched.submit("trend", s.symbol_spot, "buy", qty, now)
+                    _record_child_fills(store, s.mode, daily, fills, prices, risk)
+                if t_act is Action.FLAT:
+                    _record_child_fills(store, s.mode, daily, sched.cancel("trend", s.symbol_spot), prices, risk)
+                    held, _ = broker.ledger.position("trend", s.symbol_spot)
+                    if held:
+                        fills = sched.submit("trend", s.symbol_spot, "sell" if held > 0 else "buy", abs(held), now)
+                        _record_child_fills(store, s.mode, daily, fills, prices, risk)
+                daily.trades += 1
+                TRADES.labels(mode=s.mode, strategy="trend").inc()
+
+            elif t_act is Action.BUY and qty > 0:
+                fill = broker.buy(qty, p, slip_bps=slip_bps, strategy="trend", symbol=s.symbol_spot)
                 SLIP.set(fill.slippage_bps)
                 store.log_fill(
                     s.mode,
@@ -147,14 +343,16 @@ def run() -> None:
                     fill.qty,
                     fill.price,
                     fill.fee,
-                    0.0,
-                    f"strength={tsig.strength:.6f}",
+                    fill.pnl,
+                    "strength=%.6f",
+                    tsig.strength,
                 )
                 daily.trades += 1
+                daily.realized_pnl_usd += fill.pnl
                 TRADES.labels(mode=s.mode, strategy="trend").inc()
 
-            if tsig.action == "flat":
-                fill = broker.flatten(p)
+            elif t_act is Action.FLAT:
+                fill = broker.flatten(p, strategy="trend", symbol=s.symbol_spot)
                 SLIP.set(fill.slippage_bps)
                 store.log_fill(
                     s.mode,
@@ -172,18 +370,33 @@ def run() -> None:
                 TRADES.labels(mode=s.mode, strategy="trend").inc()
 
         # ===== Strategy 2: Pairs stat-arb (signal-only, paper proxy) =====
-        a = pub.price(s.pair_a).price
-        b = pub.price(s.pair_b).price
-        psig = pairs.on_prices(a, b)
+        psig = pairs.on_prices(a, b) if pairs is not None else None
+        p_act = psig.action if psig is not None else Action.HOLD
+        p_enter = p_act is Action.ENTER_LONG_SPREAD or p_act is Action.ENTER_SHORT_SPREAD
 
-        if psig.action in ("enter_long_spread", "enter_short_spread", "exit"):
+        if p_enter or p_act is Action.EXIT:
             slip_bps = min(12.0, risk.cfg.max_slippage_bps)
-            usd = alloc["pairs"]
+            usd = float(alloc[PAIRS])
             qty = usd / a if usd > 0 else 0.0
 
-            if psig.action in ("enter_long_spread", "enter_short_spread") and qty > 0:
-                side = "buy" if psig.action == "enter_long_spread" else "sell"
-                fill = broker.buy(qty, a, slip_bps) if side == "buy" else broker.sell(qty, a, slip_bps)
+            if sched is not None:
+                if p_enter and qty > 0:
+                    side = "buy" if p_act is Action.ENTER_LONG_SPREAD else "sell"
+                    fills = sched.submit("pairs", s.pair_a, side, qty, now)
+                    _record_child_fills(store, s.mode, daily, fills, prices, risk)
+                if p_act is Action.EXIT:
+                    _record_child_fills(store, s.mode, daily, sched.cancel("pairs", s.pair_a), prices, risk)
+                    held, _ = broker.ledger.position("pairs", s.pair_a)
+                    if held:
+                        fills = sched.submit("pairs", s.pair_a, "sell" if held > 0 else "buy", abs(held), now)
+                        _record_child_fills(store, s.mode, daily, fills, prices, risk)
+                daily.trades += 1
+                TRADES.labels(mode=s.mode, strategy="pairs").inc()
+
+            elif p_enter and qty > 0:
+                side = "buy" if p_act is Action.ENTER_LONG_SPREAD else "sell"
+                order = broker.buy if side == "buy" else broker.sell
+                fill = order(qty, a, slip_bps, strategy="pairs", symbol=s.pair_a)
                 SLIP.set(fill.slippage_bps)
                 store.log_fill(
                     s.mode,
@@ -194,14 +407,16 @@ def run() -> None:
                     fill.price,
                     fill.fee,
                     fill.pnl,
-                    f"z={psig.z:.3f}",
+                    "z=%.3f beta=%.4f",
+                    psig.z,
+                    psig.beta,
                 )
                 daily.trades += 1
                 daily.realized_pnl_usd += fill.pnl
                 TRADES.labels(mode=s.mode, strategy="pairs").inc()
 
-            if psig.action == "exit":
-                fill = broker.flatten(a)
+            elif p_act is Action.EXIT:
+                fill = broker.flatten(a, strategy="pairs", symbol=s.pair_a)
                 SLIP.set(fill.slippage_bps)
                 store.log_fill(
                     s.mode,
@@ -212,40 +427,96 @@ def run() -> None:
                     fill.price,
                     fill.fee,
                     fill.pnl,
-                    f"exit z={psig.z:.3f}",
+                    "exit z=%.3f",
+                    psig.z,
                 )
                 daily.trades += 1
                 daily.realized_pnl_usd += fill.pnl
                 TRADES.labels(mode=s.mode, strategy="pairs").inc()
 
+        # ===== Execution: work child orders =====
+        if sched is not None:
+            _record_child_fills(store, s.mode, daily, sched.step(now, prices), prices, risk)
+
+        # ===== Mark-to-market =====
+        ledger = broker.ledger
+        UNREAL.set(float(ledger.unrealized().sum()))
+        EXPOSURE.set(float(ledger.exposure().sum()))
+
         # ===== Strategy 3: Funding carry (signal-only MVP) =====
-        f_rate = 0.0
-        fsig = funding.on_funding(f_rate)
-        store.log_fill(
-            s.mode,
-            "funding",
-            s.symbol_perp,
-            fsig.action,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            f"funding={fsig.funding}",
-        )
+        if funding is not None:
+            f_rate = 0.0
+            fsig = funding.on_funding(f_rate)
+            store.log_fill(
+                s.mode,
+                "funding",
+                s.symbol_perp,
+                LABELS[fsig.action],
+                0.0,
+                0.0,
+                0.0,
+                0.0,
+                "funding=%s",
+                fsig.funding,
+            )
 
         # persist day state
         store.update_daily(daily.trades, daily.realized_pnl_usd, 0)
         PNL.set(daily.realized_pnl_usd)
 
-        log.info(
-            "px=%.2f pnl=%.2f trades=%d vol=%.6f base=%.6f trend=%s pairs=%s",
-            p,
-            daily.realized_pnl_usd,
-            daily.trades,
-            vol_now,
-            rt.vol_baseline,
-            tsig.action,
-            psig.action,
-        )
+        # sampled-out ticks never build the record or its extra dict
+        if log.isEnabledFor(logging.INFO) and log_sample("tick"):
+            log.info(
+                "tick",
+                extra={
+                    "kind": "tick",
+                    "sampled": True,
+                    "px": p,
+                    "pnl": daily.realized_pnl_usd,
+                    "trades": daily.trades,
+                    "vol": vol_now,
+                    "vol_base": rt.vol_baseline,
+                    "trend": LABELS[t_act],
+                    "pairs": LABELS[p_act],
+                },
+            )
 
+
+def run(s: Optional[Settings] = None, t0: Optional[float] = None, check: bool = False) -> None:
+    """
+    Build the engine and loop forever. `t0` is the caller's perf_counter() at
+    process start so the startup log covers imports; `check` stops after setup.
+    """
+    t_imported = time.perf_counter()
+    if t0 is None:
+        t0 = t_imported
+    if s is None:
+        s = Settings.from_env()
+
+    setup_logging(s.log_level, s.log_file, s.log_max_bytes, s.log_backups, s.log_sample)
+    if not check:
+        start_metrics(s.metrics_port)
+
+    eng = Engine(s)
+    t_ready = time.perf_counter()
+    log.info(
+        "startup",
+        extra={
+            "kind": "startup",
+            "mode": s.mode,
+            "import_ms": (t_imported - t0) * 1000.0,
+            "init_ms": (t_ready - t_imported) * 1000.0,
+            "total_ms": (t_ready - t0) * 1000.0,
+        },
+    )
+    if check:
+        return
+
+    if sys.stdout.isatty():
+        from rich.console import Console
+
+        Console().print(f"[bold]RQE[/bold] mode={s.mode} metrics_port={s.metrics_port}")
+
+    while True:
+        eng.tick()
         time.sleep(s.loop_seconds)
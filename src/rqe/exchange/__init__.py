@@ -1 +0,0 @@
-k
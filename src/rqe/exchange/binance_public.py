@@ -0,0 +1,52 @@
+import time
+from typing import Optional
+
+import requests
+
+from ..metrics import LAT_MS
+
+
+class Ticker:
+    __slots__ = ("price", "latency_ms")
+
+    def __init__(self, price: float = 0.0, latency_ms: float = 0.0) -> None:
+        self.price = price
+        self.latency_ms = latency_ms
+
+    def __repr__(self) -> str:
+        return f"Ticker(price={self.price}, latency_ms={self.latency_ms:.1f})"
+
+
+class BinancePublic:
+    BASE = "https://api.binance.com"
+    TIMEOUT_S = 5.0
+
+    def __init__(self, base: str = "") -> None:
+        if base:
+            self.BASE = base.rstrip("/")
+        # keep-alive across ticks instead of a new TCP/TLS handshake per quote
+        self.http = requests.Session()
+        self._price_url = f"{self.BASE}/api/v3/ticker/price"
+
+    def price(self, symbol: str, out: Optional[Ticker] = None) -> Ticker:
+        """Last price; pass `out` to have it filled in place instead of a new Ticker."""
+        t0 = time.time()
+        r = self.http.get(self._price_url, params={"symbol": symbol}, timeout=self.TIMEOUT_S)
+        r.raise_for_status()
+        ms = (time.time() - t0) * 1000.0
+        LAT_MS.set(ms)
+        if out is None:
+            out = Ticker()
+        out.price = float(r.json()["price"])
+        out.latency_ms = ms
+        return out
+
+    def klines(self, symbol: str, interval: str = "1h", limit: int = 1000) -> list[float]:
+        """Close prices, oldest first."""
+        r = self.http.get(
+            f"{self.BASE}/api/v3/klines",
+            params={"symbol": symbol, "interval": interval, "limit": limit},
+            timeout=10,
+        )
+        r.raise_for_status()
+        return [float(k[4]) for k in r.json()]
@@ -0,0 +1,284 @@
+"""
+Execution scheduler: slices parent orders into timed child limit orders.
+
+- twap: the parent is spread over `slices` children, one due every `interval_s`.
+- iceberg: one child of qty/slices is working at a time; the next goes out as
+  soon as the previous one fills.
+
+A working child is re-priced by cancel/replace every `chase_s` seconds. It starts
+`passive_bps` inside the mid and steps `chase_step_bps` toward the market per
+replace, up to `max_cross_bps` through it. Child ids come from
+`client_order_id(parent, child, rev)`. A child whose place or status call failed
+stays working and is re-queried every step; it is only resent under the same
+id once the venue says the id is unknown, because a closed id is reusable and
+a blind resend could double-fill. A place the venue definitely rejects (filters,
+balance) drops the whole parent: resending the same child would only be
+rejected again.
+
+Works against anything with the PaperBroker / BinanceSpotLive limit-order surface:
+`place_limit`, `order_status`, `cancel`, `forget` and a `ledger`. A child is
+forgotten once it is closed and credited, so venue-side bookkeeping stays
+bounded by the number of working children.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .broker.orders import NEW_ORDER_REJECTED, OPEN, UNKNOWN_CANCEL, UNKNOWN_ORDER, LiveFill, VenueError, client_order_id
+
+log = logging.getLogger("rqe.execution")
+
+
+@dataclass
+class ExecCfg:
+    style: str = "twap"  # twap | iceberg
+    slices: int = 5
+    interval_s: float = 10.0
+    chase_s: float = 4.0
+    passive_bps: float = 2.0
+    chase_step_bps: float = 2.0
+    max_cross_bps: float = 10.0
+    min_qty: float = 1e-8
+
+
+@dataclass
+class ParentOrder:
+    parent_id: str
+    strategy: str
+    symbol: str
+    side: str  # buy | sell
+    qty: float
+    start_ts: float
+    limit_px: float = 0.0  # worst acceptable price, 0 = none
+    filled: float = 0.0
+    quote: float = 0.0
+    child: int = 0
+    rev: int = 0
+    working: str = ""  # client_order_id of the live child
+    working_qty: float = 0.0
+    working_exec: float = 0.0  # executed qty of the live child already credited
+    working_quote: float = 0.0
+    working_ts: float = 0.0
+    working_mid: float = 0.0  # mid when the live child was placed, the slippage reference
+    canceled: bool = False
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.qty - self.filled)
+
+    @property
+    def avg_price(self) -> float:
+        return self.quote / self.filled if self.filled > 0 else 0.0
+
+
+@dataclass
+class ChildFill:
+    parent: ParentOrder
+    qty: float
+    price: float
+    fee: float
+    pnl: float
+    mid: float  # arrival mid of the child that filled
+
+
+class ExecutionScheduler:
+    def __init__(self, venue, cfg: ExecCfg) -> None:
+        self.venue = venue
+        self.cfg = cfg
+        self.parents: Dict[str, ParentOrder] = {}
+        self._seq = 0
+        self._seen: Dict[int, float] = {}  # ledger slot -> realized PnL already reported
+
+    def active(self, strategy: str, symbol: str) -> Optional[ParentOrder]:
+        for p in self.parents.values():
+            if p.strategy == strategy and p.symbol == symbol and not p.canceled:
+                return p
+        return None
+
+    def submit(
+        self, strategy: str, symbol: str, side: str, qty: float, now: float, limit_px: float = 0.0
+    ) -> List[ChildFill]:
+        """
+        Queue a parent order. Any parent already working the same (strategy, symbol)
+        is canceled first; fills that raced that cancel are returned, same as cancel().
+        """
+        fills = self.cancel(strategy, symbol)
+        self._seq += 1
+        pid = f"{int(now * 1000):x}{self._seq}"
+        self.parents[pid] = ParentOrder(pid, strategy, symbol, side, qty, now, limit_px)
+        ledger = self.venue.ledger
+        slot = ledger.slot(strategy, symbol)
+        # only the first time: later fills report against what was last reported, so nothing is dropped
+        self._seen.setdefault(slot, float(ledger.realized[slot]))
+        return fills
+
+    def cancel(self, strategy: str, symbol: str) -> List[ChildFill]:
+        """Stop a parent; fills that raced the cancel are still returned."""
+        fills: List[ChildFill] = []
+        p = self.active(strategy, symbol)
+        if p is None:
+            return fills
+        self._stop(p, fills)
+        return fills
+
+    def cancel_all(self) -> List[ChildFill]:
+        """Stop every parent (halt / breaker trip). Safe to call every tick: unsettled children are retried."""
+        fills: List[ChildFill] = []
+        for p in list(self.parents.values()):
+            self._stop(p, fills)
+        return fills
+
+    # ----- internals -----
+
+    def _stop(self, p: ParentOrder, fills: List[ChildFill]) -> None:
+        p.canceled = True
+        if p.working:
+            self._cancel_child(p, fills)
+        if not p.working:
+            del self.parents[p.parent_id]
+        # else: the child's state is unknown; step() / cancel_all() keep settling it until it is closed
+
+    def _credit(self, p: ParentOrder, executed: float, quote: float, fills: List[ChildFill]) -> None:
+        dq = executed - p.working_exec
+        if dq <= self.cfg.min_qty:
+            return
+        dquote = quote - p.working_quote
+        p.working_exec = executed
+        p.working_quote = quote
+        p.filled += dq
+        p.quote += dquote
+
+        ledger = self.venue.ledger
+        slot = ledger.slot(p.strategy, p.symbol)
+        realized = float(ledger.realized[slot])
+        pnl = realized - self._seen.get(slot, 0.0)
+        self._seen[slot] = realized
+
+        px = dquote / dq
+        fee = dquote * (getattr(self.venue, "fee_bps", 0.0) / 10_000.0)
+        fills.append(ChildFill(p, dq, px, fee, pnl, p.working_mid))
+
+    def _credit_ack(self, p: ParentOrder, ack: LiveFill, fills: List[ChildFill]) -> None:
+        self._credit(p, ack.executed_qty, ack.executed_qty * ack.avg_price, fills)
+        if ack.status not in OPEN:
+            self._clear(p, filled=ack.status == "FILLED")
+
+    def _clear(self, p: ParentOrder, filled: bool) -> None:
+        self.venue.forget(p.symbol, p.working)
+        p.working = ""
+        p.working_exec = 0.0
+        p.working_quote = 0.0
+        if filled:
+            p.child += 1
+            p.rev = 0
+        else:
+            p.rev += 1
+
+    def _cancel_child(self, p: ParentOrder, fills: List[ChildFill]) -> None:
+        try:
+            j = self.venue.cancel(p.symbol, p.working)
+        except Exception as e:  # already closed (e.g. filled meanwhile) or timed out: ask for its state
+            if not (isinstance(e, VenueError) and e.code == UNKNOWN_CANCEL):
+                log.warning("cancel failed parent=%s child=%s err=%s", p.parent_id, p.working, e)
+            self._settle(p, fills)
+            return
+        self._credit(p, float(j.get("executedQty", 0.0)), float(j.get("cummulativeQuoteQty", 0.0)), fills)
+        self._clear(p, filled=j.get("status") == "FILLED")
+
+    def _settle(self, p: ParentOrder, fills: List[ChildFill]) -> None:
+        """Credit the working child from its venue state; leave it working if that state is unknown."""
+        try:
+            ack = self.venue.order_status(p.symbol, p.working)
+        except VenueError as e:
+            if e.code == UNKNOWN_ORDER:  # never reached the venue: nothing rests, nothing to credit
+                self._clear(p, filled=False)
+            else:
+                log.warning("status failed parent=%s child=%s err=%s", p.parent_id, p.working, e)
+            return
+        except Exception as e:  # timeout etc.: retried on the next step
+            log.warning("status failed parent=%s child=%s err=%s", p.parent_id, p.working, e)
+            return
+        self._credit_ack(p, ack, fills)
+
+    def _price(self, p: ParentOrder, mid: float) -> float:
+        c = self.cfg
+        off = max(-c.max_cross_bps, c.passive_bps - p.rev * c.chase_step_bps) / 10_000.0
+        if p.side == "buy":
+            px = mid * (1 - off)
+            return min(px, p.limit_px) if p.limit_px > 0 else px
+        px = mid * (1 + off)
+        return max(px, p.limit_px) if p.limit_px > 0 else px
+
+    def _due(self, p: ParentOrder, now: float) -> float:
+        c = self.cfg
+        n = max(1, c.slices)
+        if c.style == "iceberg":
+            return min(p.qty / n, p.remaining)
+        k = min(n, int((now - p.start_ts) / max(1e-9, c.interval_s)) + 1)
+        return min(p.qty * k / n - p.filled, p.remaining)
+
+    def _place(self, p: ParentOrder, qty: float, mid: float, now: float, fills: List[ChildFill]) -> None:
+        cid = client_order_id(p.parent_id, p.child, p.rev)
+        p.working = cid
+        p.working_qty = qty
+        p.working_ts = now
+        p.working_mid = mid
+        try:
+            ack = self.venue.place_limit(p.symbol, p.side, qty, self._price(p, mid), cid, strategy=p.strategy)
+        except VenueError as e:
+            if e.code == NEW_ORDER_REJECTED and "Duplicate" in e.msg:  # an earlier send of this id landed
+                log.warning("place failed parent=%s child=%s err=%s", p.parent_id, cid, e)
+                return
+            log.error("place rejected, dropping parent=%s child=%s err=%s", p.parent_id, cid, e)
+            p.working = ""
+            p.canceled = True
+            self.parents.pop(p.parent_id, None)
+            return
+        except Exception as e:  # outcome unknown; order_status on the next step resolves it
+            log.warning("place failed parent=%s child=%s err=%s", p.parent_id, cid, e)
+            return
+        self._credit_ack(p, ack, fills)
+
+    def step(self, now: float, prices: Dict[str, float]) -> List[ChildFill]:
+        """Advance every parent: settle working children, chase stale ones, release due slices."""
+        fills: List[ChildFill] = []
+        for p in list(self.parents.values()):
+            mid = prices.get(p.symbol)
+            if mid is None and not p.canceled:
+                continue
+
+            if p.working:
+                try:
+                    ack = self.venue.order_status(p.symbol, p.working)
+                except VenueError as e:
+                    if e.code == UNKNOWN_ORDER and not p.canceled:
+                        # the place never reached the venue: resend under the same id
+                        self._place(p, p.working_qty, mid, now, fills)
+                    elif e.code == UNKNOWN_ORDER:
+                        self._clear(p, filled=False)
+                        del self.parents[p.parent_id]
+                    else:
+                        log.warning("status failed parent=%s child=%s err=%s", p.parent_id, p.working, e)
+                    continue
+                except Exception as e:
+                    # outcome unknown (timeout, 5xx): the child may have filled, so never resend blind
+                    log.warning("status failed parent=%s child=%s err=%s", p.parent_id, p.working, e)
+                    continue
+                self._credit_ack(p, ack, fills)
+                if p.working and (p.canceled or now - p.working_ts >= self.cfg.chase_s):
+                    self._cancel_child(p, fills)
+
+            if p.canceled:
+                if not p.working:
+                    del self.parents[p.parent_id]
+                continue
+
+            if not p.working and p.remaining > self.cfg.min_qty:
+                qty = self._due(p, now)
+                if qty > self.cfg.min_qty:
+                    self._place(p, qty, mid, now, fills)
+
+            if not p.working and p.remaining <= self.cfg.min_qty:
+                del self.parents[p.parent_id]
+        return fills
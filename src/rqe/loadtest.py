@@ -0,0 +1,139 @@
+"""
+Offline load test: N engine instances against rqe.mockex at a target tick rate.
+
+Each engine trades its own symbol (trend) and a neighbouring pair, ticks
+sequentially like the production loop, and gets its own SQLite file. Reports
+achieved engine-ticks/s against the target and per-tick latency tails.
+
+    python -m rqe.loadtest --symbols 1 10 50 100 --hz 1 5 --seconds 10
+    python -m rqe.loadtest --venue mock --latency-ms 20 --error-rate 0.01
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+from .config import Settings
+from .engine import Engine
+from .log import setup as setup_logging
+from .mockex import MockCfg, MockExchange, serve
+from .sketch import P2Quantile
+
+
+def _sym(i: int) -> str:
+    return f"S{i}USDT"
+
+
+def run_case(n: int, hz: float, seconds: float, base: str, tmp: str, venue: str, exec_style: str) -> dict:
+    engines: List[Engine] = []
+    for i in range(n):
+        s = Settings.from_env(
+            symbol_spot=_sym(i),
+            pair_a=_sym(i),
+            pair_b=_sym((i + 1) % max(n, 2)),  # a single engine still needs a distinct leg B: S1USDT
+            exchange_base_url=base,
+            db_path=os.path.join(tmp, f"{n}_{hz}_{i}.sqlite"),
+            exec_style=exec_style,
+            max_trades_per_day=10**9,
+            halt_on_vol_spike=0,
+            trend_fast=5,
+            trend_slow=20,
+            pair_lookback=30,
+            pair_universe_path="",
+        )
+        broker = None
+        if venue == "mock":
+            from .broker.live_binance_spot import BinanceSpotLive
+
+            broker = BinanceSpotLive("mock", "mock", rps=1e6, base=base)
+        engines.append(Engine(s, broker=broker))
+
+    p50, p99 = P2Quantile(0.5), P2Quantile(0.99)
+    worst = 0.0
+    ticks = errors = overruns = 0
+    period = 1.0 / hz
+
+    start = time.perf_counter()
+    deadline = start + seconds
+    next_round = start
+    while time.perf_counter() < deadline:
+        for eng in engines:
+            t0 = time.perf_counter()
+            try:
+                eng.tick()
+            except Exception:
+                errors += 1
+            ms = (time.perf_counter() - t0) * 1000.0
+            p50.add(ms)
+            p99.add(ms)
+            worst = max(worst, ms)
+            ticks += 1
+        next_round += period
+        lag = next_round - time.perf_counter()
+        if lag > 0:
+            time.sleep(lag)
+        else:
+            overruns += 1
+            next_round = time.perf_counter()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "symbols": n,
+        "hz": hz,
+        "target_tps": n * hz,
+        "tps": ticks / elapsed,
+        "p50_ms": p50.value(),
+        "p99_ms": p99.value(),
+        "max_ms": worst,
+        "errors": errors,
+        "overruns": overruns,
+    }
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Drive the engine against the local mock exchange.")
+    ap.add_argument("--symbols", type=int, nargs="*", default=[1, 10, 50, 100])
+    ap.add_argument("--hz", type=float, nargs="*", default=[1.0, 5.0], help="ticks per second per engine")
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--venue", default="paper", help="paper: PaperBroker fills; mock: orders go to the mock exchange")
+    ap.add_argument("--exec-style", default="", help="market | twap | iceberg (mock venue defaults to twap)")
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rps", type=float, default=0.0)
+    ap.add_argument("--log-level", default="ERROR")
+    args = ap.parse_args(argv)
+
+    exec_style = args.exec_style or ("twap" if args.venue == "mock" else "market")
+    if args.venue == "mock" and exec_style == "market":
+        ap.error("the mock venue only takes limit orders; use --exec-style twap or iceberg")
+
+    setup_logging(args.log_level)
+    cfg = MockCfg(
+        tick_hz=max(args.hz) * 2,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rps=args.rps,
+    )
+    ex = MockExchange({_sym(i): 100.0 + i for i in range(max(2, *args.symbols))}, cfg)
+    server = serve(ex)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'symbols':>8} {'hz':>6} {'target':>8} {'ticks/s':>8} {'p50ms':>8} {'p99ms':>8} {'maxms':>8} {'errors':>7} {'overrun':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.symbols:
+            for hz in args.hz:
+                r = run_case(n, hz, args.seconds, base, tmp, args.venue, exec_style)
+                print(
+                    f"{r['symbols']:>8} {r['hz']:>6g} {r['target_tps']:>8g} {r['tps']:>8.1f} {r['p50_ms']:>8.2f} "
+                    f"{r['p99_ms']:>8.2f} {r['max_ms']:>8.2f} {r['errors']:>7} {r['overruns']:>8}"
+                )
+    print(f"mock requests={ex.requests} rejected={ex.rejected}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
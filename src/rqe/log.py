@@ -1,8 +1,165 @@
+"""
+Logging off the tick thread.
+
+Callers only pay for a sampling check and a non-blocking queue put; JSON
+formatting and stdout/file writes happen on a QueueListener thread. If the
+queue is full (stdout or disk stalled) records are dropped and counted in
+rqe_log_dropped_total rather than blocking the caller.
+
+Records cross the queue unformatted, with the caller's original msg args, and
+are formatted later on the listener thread. An object that is reused and
+mutated (the per-tick signal / Fill / Ticker instances) must therefore not be
+passed as a msg arg or extra value: it would be rendered with whatever it
+holds by then. Pass its fields (floats, strings) instead.
+
+Tag records with a message type to sample them:
+
+    log.info("tick", extra={"kind": "tick", "px": p})   # LOG_SAMPLE="tick=10" keeps 1 in 10
+
+A hot path can ask first, so a sampled-out record (and its extra dict) is
+never built; the record is then marked so the filter does not count it twice:
+
+    if log.isEnabledFor(logging.INFO) and sample("tick"):
+        log.info("tick", extra={"kind": "tick", "sampled": True, "px": p})
+"""
+
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import sys
+import time
+from typing import Dict, Optional
+
+from .metrics import LOG_DROPPED
+
+# LogRecord attributes that are not user fields
+_STD = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "sampled"}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        d = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for k, v in record.__dict__.items():
+            if k not in _STD:
+                d[k] = v
+        if record.exc_info:
+            d["exc"] = self.formatException(record.exc_info)
+        return json.dumps(d, default=str)
+
+
+class SampleFilter(logging.Filter):
+    """Keep 1 in N records per `kind`; untagged and unlisted kinds always pass."""
+
+    def __init__(self, every: Dict[str, int]) -> None:
+        super().__init__()
+        self.every = every
+        self.seen: Dict[str, int] = {}
+
+    def take(self, kind: str) -> bool:
+        n = self.every.get(kind, 1)
+        if n <= 1:
+            return True
+        c = self.seen.get(kind, 0)
+        self.seen[kind] = c + 1
+        return c % n == 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False):  # already passed sample()
+            return True
+        kind = getattr(record, "kind", None)
+        return self.take(kind) if kind else True
+
+
+class DropQueueHandler(logging.handlers.QueueHandler):
+    """Non-blocking enqueue; formatting is left to the listener thread."""
+
+    def __init__(self, q: queue.Queue) -> None:
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # same process, so the record can cross the queue as-is (no pickling, no formatting here)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_DROPPED.inc()
+
+
+class _Pipeline:
+    handler: Optional[DropQueueHandler] = None
+    listener: Optional[logging.handlers.QueueListener] = None
+    sampler: Optional[SampleFilter] = None
+
+
+_pipe = _Pipeline()
+
+
+def parse_sample(spec: str) -> Dict[str, int]:
+    """Parse "tick=10,fill=1" into {"tick": 10, "fill": 1}."""
+    out: Dict[str, int] = {}
+    for part in spec.split(","):
+        if "=" in part:
+            k, v = part.split("=", 1)
+            out[k.strip()] = max(1, int(v))
+    return out
+
+
+def sample(kind: str) -> bool:
+    """True if the next `kind` record would survive LOG_SAMPLE; consumes its slot."""
+    return _pipe.sampler is None or _pipe.sampler.take(kind)
+
+
+def shutdown() -> None:
+    if _pipe.listener is not None:
+        _pipe.listener.stop()
+        _pipe.listener = None
+    if _pipe.handler is not None:
+        logging.getLogger().removeHandler(_pipe.handler)
+        _pipe.handler = None
+        _pipe.sampler = None
+
+
+def setup(
+    level: str = "INFO",
+    path: str = "",
+    max_bytes: int = 10_000_000,
+    backups: int = 5,
+    sample: str = "",
+    queue_size: int = 10_000,
+) -> None:
+    shutdown()
+
+    fmt = JsonFormatter()
+    sinks = [logging.StreamHandler(sys.stdout)]
+    if path:
+        sinks.append(logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups))
+    for h in sinks:
+        h.setFormatter(fmt)
+
+    q: queue.Queue = queue.Queue(maxsize=queue_size)
+    handler = DropQueueHandler(q)
+    sampler = SampleFilter(parse_sample(sample))
+    handler.addFilter(sampler)
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    root.addHandler(handler)
+
+    _pipe.handler = handler
+    _pipe.sampler = sampler
+    _pipe.listener = logging.handlers.QueueListener(q, *sinks, respect_handler_level=True)
+    _pipe.listener.start()
 
 
-def setup(level: str = "INFO") -> None:
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
-    )
+atexit.register(shutdown)
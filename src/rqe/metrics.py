@@ -7,6 +7,11 @@ PNL = Gauge("rqe_realized_pnl_usd", "Realized PnL USD")
 LAT_MS = Gauge("rqe_api_latency_ms", "API latency ms")
 SLIP = Gauge("rqe_slippage_bps", "Last slippage bps")
 STATE = Gauge("rqe_halted", "Halted flag (1/0)")
+UNREAL = Gauge("rqe_unrealized_pnl_usd", "Unrealized PnL USD across all positions")
+EXPOSURE = Gauge("rqe_gross_exposure_usd", "Gross notional USD across all positions")
+QUANTILE = Gauge("rqe_breaker_quantile", "Streaming tail quantile watched by the breaker", ["kind", "endpoint"])
+LOG_DROPPED = Counter("rqe_log_dropped_total", "Log records dropped because the log queue was full")
+BREAKER = Gauge("rqe_breaker_state", "Latency/slippage breaker (0 ok, 1 degraded, 2 tripped)")
 
 
 @dataclass
@@ -0,0 +1,356 @@
+"""
+Local mock of the Binance spot REST surface the engine uses, for offline runs.
+
+    GET    /api/v3/ticker/price   ?symbol=
+    GET    /api/v3/klines         ?symbol=&limit=          (one bar per path step)
+    POST   /api/v3/order          LIMIT orders, newClientOrderId is idempotent
+    GET    /api/v3/order          ?origClientOrderId=
+    DELETE /api/v3/order          ?origClientOrderId=
+    GET    /ws/<symbol>@trade     optional WebSocket trade stream
+
+Prices follow a seeded random walk per symbol (or a scripted list that loops),
+advancing `tick_hz` steps per second. Latency, 5xx errors and 429 rate limits
+can be injected. Signatures are not checked.
+
+    python -m rqe.mockex --port 8765 --symbols BTCUSDT=60000 ETHUSDT=3000 --latency-ms 20
+    BINANCE_BASE_URL=http://127.0.0.1:8765 scripts/run_paper.sh
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import math
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+@dataclass
+class MockCfg:
+    tick_hz: float = 10.0
+    vol: float = 0.0005  # per-step log-return sigma
+    history: int = 1000  # steps generated before t0, served by klines
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0  # fraction of requests answered with HTTP 500
+    rps: float = 0.0  # token-bucket request limit, 0 = unlimited; excess gets 429
+    seed: int = 7
+
+
+class PricePath:
+    """Lazily extended random walk, or a scripted list that loops."""
+
+    def __init__(self, start: float, vol: float, rng: random.Random, script: Optional[List[float]] = None) -> None:
+        self.vol = vol
+        self.rng = rng
+        self.script = script
+        self.xs = [start]
+
+    def at(self, step: int) -> float:
+        if self.script:
+            return self.script[step % len(self.script)]
+        while len(self.xs) <= step:
+            self.xs.append(self.xs[-1] * math.exp(self.rng.gauss(0.0, self.vol)))
+        return self.xs[step]
+
+
+class MockExchange:
+    def __init__(self, symbols: Dict[str, float], cfg: MockCfg, scripts: Optional[Dict[str, List[float]]] = None) -> None:
+        self.cfg = cfg
+        self.rng = random.Random(cfg.seed)
+        scripts = scripts or {}
+        self.paths = {s: PricePath(p, cfg.vol, random.Random(f"{cfg.seed}:{s}"), scripts.get(s)) for s, p in symbols.items()}
+        self.t0 = time.monotonic()
+        self.lock = threading.Lock()
+        self.orders: Dict[Tuple[str, str], dict] = {}
+        self.resting: Dict[str, Dict[str, dict]] = {s: {} for s in symbols}  # open orders per symbol
+        self._next_id = 1
+        self._tokens = cfg.rps
+        self._refill = time.monotonic()
+        self.requests = 0
+        self.rejected = 0
+
+    # ----- market -----
+
+    def step(self) -> int:
+        return self.cfg.history + int((time.monotonic() - self.t0) * self.cfg.tick_hz)
+
+    def price(self, symbol: str) -> float:
+        with self.lock:
+            px = self.paths[symbol].at(self.step())
+            self._match(symbol, px)
+            return px
+
+    def closes(self, symbol: str, limit: int) -> List[float]:
+        with self.lock:
+            end = self.step()
+            path = self.paths[symbol]
+            return [path.at(i) for i in range(max(0, end - limit + 1), end + 1)]
+
+    # ----- faults -----
+
+    def gate(self) -> Optional[Tuple[int, dict]]:
+        """Apply injected latency / rate limit / errors. Returns an error response or None."""
+        c = self.cfg
+        with self.lock:
+            self.requests += 1
+            if c.rps > 0:
+                now = time.monotonic()
+                self._tokens = min(c.rps, self._tokens + (now - self._refill) * c.rps)
+                self._refill = now
+                if self._tokens < 1.0:
+                    self.rejected += 1
+                    return 429, {"code": -1003, "msg": "Too many requests; current limit exceeded."}
+                self._tokens -= 1.0
+            fail = c.error_rate > 0 and self.rng.random() < c.error_rate
+            delay = c.latency_ms + (self.rng.random() * c.jitter_ms if c.jitter_ms else 0.0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if fail:
+            with self.lock:
+                self.rejected += 1
+            return 500, {"code": -1000, "msg": "An unknown error occurred while processing the request."}
+        return None
+
+    # ----- orders -----
+
+    def _view(self, o: dict) -> dict:
+        return {
+            "symbol": o["symbol"],
+            "orderId": o["orderId"],
+            "clientOrderId": o["clientOrderId"],
+            "transactTime": o["time"],
+            "price": f"{o['price']:.8f}",
+            "origQty": f"{o['qty']:.8f}",
+            "executedQty": f"{o['executed']:.8f}",
+            "cummulativeQuoteQty": f"{o['quote']:.8f}",
+            "status": o["status"],
+            "timeInForce": "GTC",
+            "type": "LIMIT",
+            "side": o["side"],
+        }
+
+    def _fill(self, o: dict, px: float) -> None:
+        crosses = px <= o["price"] if o["side"] == "BUY" else px >= o["price"]
+        if o["status"] in ("NEW", "PARTIALLY_FILLED") and crosses:
+            qty = o["qty"] - o["executed"]
+            o["executed"] = o["qty"]
+            o["quote"] += qty * (px if o["arrival"] else o["price"])
+            o["status"] = "FILLED"
+
+    def _match(self, symbol: str, px: float) -> None:
+        book = self.resting.get(symbol)
+        if not book:
+            return
+        for cid, o in list(book.items()):
+            o["arrival"] = False
+            self._fill(o, px)
+            if o["status"] == "FILLED":
+                del book[cid]
+
+    def place(self, q: dict) -> Tuple[int, dict]:
+        sym = q["symbol"]
+        cid = q.get("newClientOrderId") or f"mock-{self._next_id}"
+        if sym not in self.paths:
+            return 400, {"code": -1121, "msg": "Invalid symbol."}
+        with self.lock:
+            key = (sym, cid)
+            o = self.orders.get(key)
+            if o is not None and o["status"] in ("NEW", "PARTIALLY_FILLED"):
+                return 400, {"code": -2010, "msg": "Duplicate order sent."}
+            o = self.orders[key] = {
+                "symbol": sym,
+                "orderId": self._next_id,
+                "clientOrderId": cid,
+                "time": int(time.time() * 1000),
+                "side": q["side"].upper(),
+                "qty": float(q["quantity"]),
+                "price": float(q["price"]),
+                "executed": 0.0,
+                "quote": 0.0,
+                "status": "NEW",
+                "arrival": True,
+            }
+            self._next_id += 1
+            self._fill(o, self.paths[sym].at(self.step()))
+            if o["status"] == "NEW":
+                self.resting[sym][cid] = o
+            return 200, self._view(o)
+
+    def query(self, q: dict) -> Tuple[int, dict]:
+        sym = q["symbol"]
+        self.price(sym)  # let resting orders see the current price
+        with self.lock:
+            o = self.orders.get((sym, q.get("origClientOrderId", "")))
+            if o is None:
+                return 400, {"code": -2013, "msg": "Order does not exist."}
+            return 200, self._view(o)
+
+    def cancel(self, q: dict) -> Tuple[int, dict]:
+        sym = q["symbol"]
+        self.price(sym)
+        with self.lock:
+            o = self.orders.get((sym, q.get("origClientOrderId", "")))
+            if o is None or o["status"] not in ("NEW", "PARTIALLY_FILLED"):
+                return 400, {"code": -2011, "msg": "Unknown order sent."}
+            o["status"] = "CANCELED"
+            self.resting[sym].pop(o["clientOrderId"], None)
+            return 200, self._view(o)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    ex: MockExchange
+
+    def log_message(self, fmt, *args) -> None:
+        pass
+
+    def _send(self, code: int, body) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if code == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, method: str) -> None:
+        u = urlparse(self.path)
+        q = {k: v[0] for k, v in parse_qs(u.query).items()}
+        n = int(self.headers.get("Content-Length") or 0)
+        if n:
+            q.update({k: v[0] for k, v in parse_qs(self.rfile.read(n).decode()).items()})
+
+        if method == "GET" and u.path.startswith("/ws/"):
+            return self._ws(u.path[4:])
+
+        err = self.ex.gate()
+        if err is not None:
+            return self._send(*err)
+        if "symbol" in q and q["symbol"] not in self.ex.paths:
+            return self._send(400, {"code": -1121, "msg": "Invalid symbol."})
+
+        try:
+            if method == "GET" and u.path == "/api/v3/ticker/price":
+                return self._send(200, {"symbol": q["symbol"], "price": f"{self.ex.price(q['symbol']):.8f}"})
+            if method == "GET" and u.path == "/api/v3/klines":
+                closes = self.ex.closes(q["symbol"], int(q.get("limit", 500)))
+                now = int(time.time() * 1000)
+                bars = [[now, f"{c:.8f}", f"{c:.8f}", f"{c:.8f}", f"{c:.8f}", "0", now] for c in closes]
+                return self._send(200, bars)
+            if u.path == "/api/v3/order":
+                if method == "POST":
+                    return self._send(*self.ex.place(q))
+                if method == "GET":
+                    return self._send(*self.ex.query(q))
+                if method == "DELETE":
+                    return self._send(*self.ex.cancel(q))
+        except KeyError as e:
+            return self._send(400, {"code": -1102, "msg": f"Mandatory parameter {e} was not sent."})
+        self._send(404, {"code": -1, "msg": "not found"})
+
+    def _ws(self, stream: str) -> None:
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+
+        sym = stream.split("@", 1)[0].upper()
+        period = 1.0 / max(0.1, self.ex.cfg.tick_hz)
+        try:
+            while sym in self.ex.paths:
+                msg = json.dumps({"e": "trade", "E": int(time.time() * 1000), "s": sym, "p": f"{self.ex.price(sym):.8f}", "q": "1"})
+                self.wfile.write(_ws_frame(msg.encode()))
+                self.wfile.flush()
+                time.sleep(period)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    def do_GET(self) -> None:
+        self._route("GET")
+
+    def do_POST(self) -> None:
+        self._route("POST")
+
+    def do_DELETE(self) -> None:
+        self._route("DELETE")
+
+
+def _ws_frame(payload: bytes) -> bytes:
+    n = len(payload)
+    if n < 126:
+        return bytes([0x81, n]) + payload
+    if n < 1 << 16:
+        return bytes([0x81, 126]) + struct.pack(">H", n) + payload
+    return bytes([0x81, 127]) + struct.pack(">Q", n) + payload
+
+
+def serve(ex: MockExchange, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the mock in a daemon thread. `server.server_address` has the bound port."""
+    handler = type("MockHandler", (_Handler,), {"ex": ex})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="rqe-mockex", daemon=True).start()
+    return server
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Local mock Binance spot exchange.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--symbols", nargs="*", default=["BTCUSDT=60000", "ETHUSDT=3000"], help="SYMBOL=start_price")
+    ap.add_argument("--script", default="", help='JSON {"SYMBOL": [prices...]} looped instead of a random walk')
+    ap.add_argument("--tick-hz", type=float, default=10.0)
+    ap.add_argument("--vol", type=float, default=0.0005)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rps", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    symbols = {}
+    for item in args.symbols:
+        sym, _, px = item.partition("=")
+        symbols[sym] = float(px or 100.0)
+    scripts = None
+    if args.script:
+        with open(args.script) as f:
+            scripts = {k: [float(x) for x in v] for k, v in json.load(f).items()}
+        for sym, xs in scripts.items():
+            symbols.setdefault(sym, xs[0])
+
+    cfg = MockCfg(
+        tick_hz=args.tick_hz,
+        vol=args.vol,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rps=args.rps,
+        seed=args.seed,
+    )
+    server = serve(MockExchange(symbols, cfg, scripts), args.host, args.port)
+    print(f"mock exchange on http://{args.host}:{server.server_address[1]} symbols={','.join(symbols)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
+
+import numpy as np
+
+# sleeve index into RiskAllocator arrays
+TREND, PAIRS, FUNDING = 0, 1, 2
 
 
 @dataclass
@@ -28,3 +33,123 @@ def allocate(notional_usd: float, w: Weights) -> Alloc:
             "funding": notional_usd * w.funding,
         }
     )
+
+
+class EwmaCov:
+    """Exponentially weighted mean/covariance of k return streams, O(k^2) per update."""
+
+    def __init__(self, k: int, lam: float = 0.97) -> None:
+        self.lam = lam
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.cov = np.zeros((k, k))
+        self._d = np.zeros(k)
+
+    def update(self, r: np.ndarray) -> None:
+        if self.n == 0:
+            self.mean[:] = r
+        else:
+            a = 1.0 - self.lam
+            np.subtract(r, self.mean, out=self._d)
+            self.mean += a * self._d
+            self.cov *= self.lam
+            self.cov += (self.lam * a) * np.outer(self._d, self._d)
+        self.n += 1
+
+    def vol(self) -> np.ndarray:
+        return np.sqrt(np.maximum(np.diag(self.cov), 0.0))
+
+
+def risk_parity(cov: np.ndarray, iters: int = 50, tol: float = 1e-10) -> np.ndarray:
+    """Equal-risk-contribution weights (sum 1) by the x = sqrt(x / (C x)) fixed point."""
+    x = 1.0 / np.sqrt(np.maximum(np.diag(cov), 1e-300))
+    x /= x.sum()
+    for _ in range(iters):
+        cx = np.maximum(cov @ x, 1e-300)
+        nx = np.sqrt(x / cx)
+        nx /= nx.sum()
+        if np.abs(nx - x).max() < tol:
+            return nx
+        x = nx
+    return x
+
+
+class RiskAllocator:
+    """
+    Sleeve weights from an incrementally updated EWMA covariance of sleeve returns.
+
+    method: static (base weights, nothing else) | vol_target | risk_parity
+    (equal risk contribution among the enabled sleeves with measurable
+    variance; the rest keep their base weight). Under vol_target and
+    risk_parity, sleeves with a vol target (daily, as a fraction) are then
+    scaled by min(max_scale, target / realized daily vol); weight scaled away
+    stays in cash rather than moving to the other sleeves.
+
+    Weights are only re-solved once the covariance has moved more than `tol`
+    (relative Frobenius norm) since the last solve; otherwise the cached array
+    is reused.
+    """
+
+    def __init__(
+        self,
+        base: np.ndarray,
+        method: str = "static",
+        vol_targets: Optional[np.ndarray] = None,
+        periods_per_day: float = 43_200.0,
+        lam: float = 0.97,
+        tol: float = 0.05,
+        min_obs: int = 30,
+        max_scale: float = 1.0,
+        min_vol: float = 1e-12,
+    ) -> None:
+        k = len(base)
+        self.base = np.asarray(base, dtype=float) / max(1e-9, float(np.sum(base)))
+        self.method = method
+        self.vol_targets = np.zeros(k) if vol_targets is None else np.asarray(vol_targets, dtype=float)
+        self.day_scale = float(np.sqrt(periods_per_day))
+        self.tol = tol
+        self.min_obs = min_obs
+        self.max_scale = max_scale
+        self.min_vol = min_vol
+
+        self.est = EwmaCov(k, lam)
+        self.weights = self.base.copy()
+        self.out = np.zeros(k)
+        self.solves = 0
+        self._solved_cov: Optional[np.ndarray] = None
+
+    def update(self, returns: np.ndarray) -> bool:
+        """Feed one period of sleeve returns; returns True if weights were re-solved."""
+        self.est.update(returns)
+        if self.method == "static" or self.est.n < self.min_obs:
+            return False
+        cov = self.est.cov
+        if self._solved_cov is not None:
+            ref = np.linalg.norm(self._solved_cov)
+            if ref > 0 and np.linalg.norm(cov - self._solved_cov) <= self.tol * ref:
+                return False
+        self._solve(cov)
+        return True
+
+    def _solve(self, cov: np.ndarray) -> None:
+        vol = np.sqrt(np.maximum(np.diag(cov), 0.0))
+        live = (vol > self.min_vol) & (self.base > 0)  # a zero base weight means the sleeve is off
+        w = self.base.copy()
+
+        if self.method == "risk_parity" and live.sum() > 1:
+            budget = 1.0 - w[~live].sum()
+            w[live] = budget * risk_parity(cov[np.ix_(live, live)])
+
+        targeted = live & (self.vol_targets > 0)
+        if targeted.any():
+            daily = vol[targeted] * self.day_scale
+            w[targeted] *= np.minimum(self.max_scale, self.vol_targets[targeted] / daily)
+
+        self.weights = w
+        self._solved_cov = cov.copy()
+        self.solves += 1
+
+    def allocate(self, notional_usd: float) -> np.ndarray:
+        """USD per sleeve, written into a reused array."""
+        np.multiply(self.weights, notional_usd, out=self.out)
+        return self.out
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+from .sketch import WindowedQuantile
 
 
 @dataclass
@@ -11,19 +14,122 @@ class RiskCfg:
     max_api_latency_ms: int
     halt_on_vol_spike: bool
     vol_spike_mult: float
+    breaker_quantile: float = 0.99
+    breaker_window: int = 300
+    breaker_degrade_at: float = 0.75  # fraction of a bound that starts degrading
+    breaker_degrade_scale: float = 0.5  # notional multiplier while degraded
+    breaker_recover_ratio: float = 0.8  # must fall below ratio * threshold to step down
+    breaker_recover_ticks: int = 30  # consecutive calm updates before stepping down
+    breaker_stale_ticks: int = 300  # a (kind, endpoint) with no observation for this many updates is dropped
 
 
-@dataclass
 class RiskState:
-    equity_usd: float
-    trades_today: int
-    realized_pnl_usd: float
-    halted: bool
+    __slots__ = ("equity_usd", "trades_today", "realized_pnl_usd", "halted")
+
+    def __init__(self, equity_usd: float = 0.0, trades_today: int = 0, realized_pnl_usd: float = 0.0, halted: bool = False) -> None:
+        self.equity_usd = equity_usd
+        self.trades_today = trades_today
+        self.realized_pnl_usd = realized_pnl_usd
+        self.halted = halted
+
+
+BREAKER_OK = 0
+BREAKER_DEGRADED = 1
+BREAKER_TRIPPED = 2
+
+
+class LatencyBreaker:
+    """
+    Trips on tail exchange latency / realized slippage per endpoint.
+
+    Keeps a windowed streaming quantile per (kind, endpoint). The worst
+    quantile/bound ratio drives the state: >= 1 trips, >= degrade_at degrades.
+    Escalation is immediate; stepping down one level needs the ratio to stay
+    below recover_ratio * threshold for recover_ticks consecutive updates.
+
+    Slippage is only observed while trading, so a trip would freeze its
+    quantile above the bound for good; a sketch that has not been fed for
+    stale_ticks updates is dropped and starts fresh on its next observation.
+    `dropped` lists the keys the last update() removed.
+    """
+
+    def __init__(self, cfg: RiskCfg) -> None:
+        self.cfg = cfg
+        self.bounds = {"latency_ms": float(cfg.max_api_latency_ms), "slippage_bps": float(cfg.max_slippage_bps)}
+        self.sketches: Dict[Tuple[str, str], WindowedQuantile] = {}
+        self.state = BREAKER_OK
+        self.ratio = 0.0
+        self._calm = 0
+        self._updates = 0
+        self._last_obs: Dict[Tuple[str, str], int] = {}
+        self.dropped: List[Tuple[str, str]] = []
+
+    def _sketch(self, kind: str, endpoint: str) -> WindowedQuantile:
+        key = (kind, endpoint)
+        self._last_obs[key] = self._updates
+        sk = self.sketches.get(key)
+        if sk is None:
+            sk = self.sketches[key] = WindowedQuantile(self.cfg.breaker_quantile, self.cfg.breaker_window)
+        return sk
+
+    def observe_latency(self, endpoint: str, ms: float) -> None:
+        self._sketch("latency_ms", endpoint).add(ms)
+
+    def observe_slippage(self, endpoint: str, bps: float) -> None:
+        """`bps` is signed, positive = adverse; fills that beat the mid count as zero."""
+        self._sketch("slippage_bps", endpoint).add(max(0.0, bps))
+
+    def quantiles(self) -> Iterator[Tuple[str, str, float]]:
+        for (kind, endpoint), sk in self.sketches.items():
+            yield kind, endpoint, sk.value()
+
+    def update(self) -> int:
+        c = self.cfg
+        self._updates += 1
+        dropped = self.dropped  # reused: nothing is allocated unless a sketch actually goes stale
+        dropped.clear()
+        for key, last in self._last_obs.items():
+            if self._updates - last > c.breaker_stale_ticks:
+                dropped.append(key)
+        for key in dropped:
+            del self._last_obs[key]
+            del self.sketches[key]
+
+        ratio = 0.0
+        for (kind, _), sk in self.sketches.items():
+            bound = self.bounds[kind]
+            if bound > 0:
+                ratio = max(ratio, sk.value() / bound)
+        self.ratio = ratio
+
+        target = BREAKER_TRIPPED if ratio >= 1.0 else BREAKER_DEGRADED if ratio >= c.breaker_degrade_at else BREAKER_OK
+        if target >= self.state:
+            self.state = target
+            self._calm = 0
+            return self.state
+
+        threshold = 1.0 if self.state == BREAKER_TRIPPED else c.breaker_degrade_at
+        if ratio < threshold * c.breaker_recover_ratio:
+            self._calm += 1
+            if self._calm >= c.breaker_recover_ticks:
+                self.state -= 1
+                self._calm = 0
+        else:
+            self._calm = 0
+        return self.state
+
+    def scale(self) -> float:
+        if self.state == BREAKER_TRIPPED:
+            return 0.0
+        if self.state == BREAKER_DEGRADED:
+            return self.cfg.breaker_degrade_scale
+        return 1.0
 
 
 class RiskManager:
     def __init__(self, cfg: RiskCfg) -> None:
         self.cfg = cfg
+        self.breaker = LatencyBreaker(cfg)
 
     def daily_limits_ok(self, st: RiskState) -> tuple[bool, str]:
         if st.halted:
@@ -43,4 +149,4 @@ class RiskManager:
         return True, "ok"
 
     def cap_notional(self, desired_usd: float) -> float:
-        return min(desired_usd, self.cfg.max_notional_usd)
+        return min(desired_usd, self.cfg.max_notional_usd) * self.breaker.scale()
@@ -0,0 +1,184 @@
+"""
+Cointegration universe scanner.
+
+Tests every ordered pair of N symbols (Engle-Granger: OLS hedge ratio, then a
+Dickey-Fuller regression on the residual) and ranks the survivors by ADF t-stat
+and mean-reversion half-life. Pairs with a hedge ratio <= `min_beta` are
+dropped: the engine trades only leg A against a long/short spread view, which
+assumes the legs move together. Work is batched as NumPy array ops per block of
+anchor symbols and spread across a process pool.
+
+    python -m rqe.scanner BTCUSDT ETHUSDT SOLUSDT ... --out pairs.json
+
+The engine loads the output via PAIR_UNIVERSE_PATH.
+"""
+
+import argparse
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Engle-Granger 5% critical value, two variables with constant
+ADF_CRIT_5 = -3.34
+
+
+@dataclass
+class PairCandidate:
+    a: str
+    b: str
+    beta: float
+    alpha: float
+    adf_t: float
+    half_life: float
+
+
+# per-worker state, set once by _init so the price matrix is not re-pickled per task
+_C: np.ndarray = np.empty((0, 0))
+_MEAN: np.ndarray = np.empty(0)
+_VAR: np.ndarray = np.empty(0)
+
+
+def _init(logp: np.ndarray) -> None:
+    global _C, _MEAN, _VAR
+    _MEAN = logp.mean(axis=0)
+    _C = logp - _MEAN
+    _VAR = (_C * _C).sum(axis=0)
+
+
+def _scan_block(anchors: Sequence[int]) -> tuple[np.ndarray, ...]:
+    """Regress each anchor column on every column at once; returns (beta, alpha, adf_t, gamma), each N x B."""
+    idx = np.asarray(anchors)
+    Y = _C[:, idx]  # T x B
+
+    beta = (_C.T @ Y) / np.maximum(_VAR, 1e-18)[:, None]  # N x B
+    alpha = _MEAN[idx][None, :] - beta * _MEAN[:, None]
+
+    R = Y[:, None, :] - _C[:, :, None] * beta[None, :, :]  # T x N x B
+    lag = R[:-1]
+    d = R[1:] - lag
+
+    sxx = np.maximum((lag * lag).sum(axis=0), 1e-18)
+    gamma = (lag * d).sum(axis=0) / sxx
+    e = d - gamma[None] * lag
+    s2 = (e * e).sum(axis=0) / max(1, R.shape[0] - 2)
+    t = gamma / np.sqrt(np.maximum(s2, 1e-300) / sxx)
+    return beta, alpha, t, gamma
+
+
+def _half_life(gamma: float) -> float:
+    if -1.0 < gamma < 0.0:
+        return -math.log(2.0) / math.log1p(gamma)
+    return math.inf
+
+
+def scan(
+    prices: Dict[str, Sequence[float]],
+    workers: int = 0,
+    block: int = 8,
+    adf_crit: float = ADF_CRIT_5,
+    min_half_life: float = 1.0,
+    max_half_life: float = 500.0,
+    top: int = 50,
+    min_beta: float = 0.0,
+) -> List[PairCandidate]:
+    """Rank cointegrated pairs from aligned close histories (one sequence per symbol, oldest first)."""
+    syms = list(prices)
+    n_obs = min(len(v) for v in prices.values())
+    logp = np.log(np.maximum(np.array([prices[s][-n_obs:] for s in syms], dtype=float).T, 1e-9))
+
+    blocks = [list(range(i, min(i + block, len(syms)))) for i in range(0, len(syms), block)]
+    if workers == 1:
+        _init(logp)
+        results = [_scan_block(bl) for bl in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None, initializer=_init, initargs=(logp,)) as ex:
+            results = list(ex.map(_scan_block, blocks))
+
+    out: List[PairCandidate] = []
+    for bl, (beta, alpha, t, gamma) in zip(blocks, results):
+        # rows = regressor b, cols = anchor a
+        rows, cols = np.nonzero(t < adf_crit)
+        for j, k in zip(rows.tolist(), cols.tolist()):
+            i = bl[k]
+            if i == j or beta[j, k] <= min_beta:
+                continue
+            hl = _half_life(float(gamma[j, k]))
+            if not (min_half_life <= hl <= max_half_life):
+                continue
+            out.append(
+                PairCandidate(
+                    a=syms[i],
+                    b=syms[j],
+                    beta=float(beta[j, k]),
+                    alpha=float(alpha[j, k]),
+                    adf_t=float(t[j, k]),
+                    half_life=hl,
+                )
+            )
+
+    out.sort(key=lambda c: (c.adf_t, c.half_life))
+    # (a, b) and (b, a) are the same pair; keep the better-ranked orientation only
+    seen, ranked = set(), []
+    for c in out:
+        key = frozenset((c.a, c.b))
+        if key not in seen:
+            seen.add(key)
+            ranked.append(c)
+    return ranked[:top]
+
+
+def save_ranked(path: str, pairs: List[PairCandidate]) -> None:
+    with open(path, "w") as f:
+        json.dump([asdict(p) for p in pairs], f, indent=2)
+
+
+def load_ranked(path: str) -> List[PairCandidate]:
+    with open(path) as f:
+        return [PairCandidate(**p) for p in json.load(f)]
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Rank cointegrated pairs over a symbol universe.")
+    ap.add_argument("symbols", nargs="*")
+    ap.add_argument("--symbols-file", default="", help="one symbol per line")
+    ap.add_argument("--interval", default="1h")
+    ap.add_argument("--limit", type=int, default=1000)
+    ap.add_argument("--workers", type=int, default=0, help="0 = os.cpu_count()")
+    ap.add_argument("--top", type=int, default=50)
+    ap.add_argument("--adf-crit", type=float, default=ADF_CRIT_5)
+    ap.add_argument("--max-half-life", type=float, default=500.0)
+    ap.add_argument("--min-beta", type=float, default=0.0, help="drop pairs whose hedge ratio is <= this")
+    ap.add_argument("--out", default="pairs.json")
+    ap.add_argument("--base", default="", help="REST base URL (e.g. a local rqe.mockex)")
+    args = ap.parse_args(argv)
+
+    from .exchange.binance_public import BinancePublic
+
+    syms = list(args.symbols)
+    if args.symbols_file:
+        with open(args.symbols_file) as f:
+            syms += [ln.strip() for ln in f if ln.strip()]
+
+    pub = BinancePublic(args.base)
+    prices = {s: pub.klines(s, args.interval, args.limit) for s in syms}
+
+    ranked = scan(
+        prices,
+        workers=args.workers,
+        adf_crit=args.adf_crit,
+        max_half_life=args.max_half_life,
+        top=args.top,
+        min_beta=args.min_beta,
+    )
+    save_ranked(args.out, ranked)
+    for p in ranked[:10]:
+        print(f"{p.a}/{p.b} beta={p.beta:.4f} adf_t={p.adf_t:.2f} half_life={p.half_life:.1f}")
+    print(f"{len(ranked)} pairs -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
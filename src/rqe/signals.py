@@ -0,0 +1,25 @@
+"""
+Actions shared by strategies, brokers and the engine.
+
+Actions are small ints (IntEnum members are singletons, so comparing or
+passing them allocates nothing); LABELS maps them back to the strings stored
+in the audit trail. Strategies and brokers hand back one reused, slotted
+result object per instance: read it before the next call, don't keep it.
+"""
+
+from enum import IntEnum
+
+
+class Action(IntEnum):
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+    FLAT = 3
+    ENTER_LONG_SPREAD = 4
+    ENTER_SHORT_SPREAD = 5
+    EXIT = 6
+    ENABLE = 7
+    DISABLE = 8
+
+
+LABELS = tuple(a.name.lower() for a in Action)
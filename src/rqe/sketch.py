@@ -0,0 +1,156 @@
+"""
+Streaming quantile estimates in O(1) memory.
+
+P2Quantile is the P-square estimator (Jain & Chlamtac, 1985): five markers per
+quantile, updated with a piecewise-parabolic step per observation, no samples
+stored. WindowedQuantile rotates two of them so the estimate forgets old
+regimes instead of averaging over the whole process lifetime. RollingMoments
+is the exact fixed-window counterpart for mean/std.
+"""
+
+import math
+from collections import deque
+from typing import List
+
+
+class P2Quantile:
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.count = 0
+        self.q: List[float] = []  # marker heights
+        self.n = [0, 1, 2, 3, 4]  # marker positions
+        self.np = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]  # desired positions
+        self.dn = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        q = self.q
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.n
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.np[i] += self.dn[i]
+
+        for i in (1, 2, 3):
+            d = self.np[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                qp = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not (q[i - 1] < qp < q[i + 1]):
+                    qp = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                q[i] = qp
+                n[i] += s
+
+    def value(self) -> float:
+        if self.count == 0:
+            return 0.0
+        if self.count <= 5:
+            return self.q[min(len(self.q) - 1, int(round(self.p * (len(self.q) - 1))))]
+        return self.q[2]
+
+
+class WindowedQuantile:
+    """
+    Two P2Quantile estimators rotated every `window` observations.
+
+    The estimate is the larger of the last full window and the current one
+    (once it has `min_samples`), so a bad stretch shows up quickly but only
+    ages out after a full clean window.
+    """
+
+    def __init__(self, p: float, window: int = 500, min_samples: int = 20) -> None:
+        self.p = p
+        self.window = window
+        self.min_samples = min_samples
+        self.cur = P2Quantile(p)
+        self.prev: P2Quantile = P2Quantile(p)
+
+    @property
+    def count(self) -> int:
+        return self.prev.count + self.cur.count
+
+    def add(self, x: float) -> None:
+        self.cur.add(x)
+        if self.cur.count >= self.window:
+            self.prev = self.cur
+            self.cur = P2Quantile(self.p)
+
+    def value(self) -> float:
+        v = self.prev.value() if self.prev.count >= self.min_samples else 0.0
+        if self.cur.count >= self.min_samples:
+            v = max(v, self.cur.value())
+        return v
+
+
+class RollingMoments:
+    """
+    Mean / sample std over the last `n` values in O(1) per push.
+
+    Values are shifted by the first one seen to limit cancellation in the
+    running sum of squares, and the sums are rebuilt from the window every
+    `resync` pushes so rounding error cannot accumulate.
+    """
+
+    __slots__ = ("n", "xs", "ref", "s1", "s2", "resync", "_since")
+
+    def __init__(self, n: int, resync: int = 0) -> None:
+        self.n = n
+        self.xs: deque = deque(maxlen=n)
+        self.ref = None
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.resync = resync or 64 * n
+        self._since = 0
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def push(self, x: float) -> None:
+        if self.ref is None:
+            self.ref = x
+        x -= self.ref
+        xs = self.xs
+        if len(xs) == self.n:
+            old = xs[0]
+            self.s1 -= old
+            self.s2 -= old * old
+        xs.append(x)
+        self.s1 += x
+        self.s2 += x * x
+
+        self._since += 1
+        if self._since >= self.resync:
+            self._since = 0
+            self.s1 = math.fsum(xs)
+            self.s2 = math.fsum(v * v for v in xs)
+
+    def mean(self) -> float:
+        k = len(self.xs)
+        return self.ref + self.s1 / k if k else 0.0
+
+    def std(self) -> float:
+        k = len(self.xs)
+        if k < 2:
+            return 0.0
+        m = self.s1 / k
+        v = (self.s2 - k * m * m) / (k - 1)
+        return math.sqrt(v) if v > 0 else 0.0
@@ -82,7 +82,11 @@ class Store:
         fee: float,
         pnl: float,
         note: str,
+        *note_args,
     ) -> None:
+        """`note` may be a %-format string; it is only formatted here, with `note_args`."""
+        if note_args:
+            note = note % note_args
         with sqlite3.connect(self.path) as con:
             con.execute(
                 "INSERT INTO fills(ts,mode,strategy,symbol,side,qty,price,fee,pnl,note) VALUES(?,?,?,?,?,?,?,?,?,?)",
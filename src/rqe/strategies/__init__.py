@@ -1 +0,0 @@
-K
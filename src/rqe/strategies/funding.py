@@ -1,11 +1,17 @@
-from dataclasses import dataclass
 import time
 
+from ..signals import Action, LABELS
+
 
-@dataclass
 class FundingSignal:
-    action: str  # hold | enable | disable
-    funding: float
+    __slots__ = ("action", "funding")
+
+    def __init__(self, action: Action = Action.HOLD, funding: float = 0.0) -> None:
+        self.action = action  # HOLD | ENABLE | DISABLE
+        self.funding = funding
+
+    def __repr__(self) -> str:
+        return f"FundingSignal({LABELS[self.action]}, {self.funding})"
 
 
 class FundingCarry:
@@ -16,17 +22,23 @@ class FundingCarry:
         self.hold_hrs = hold_hrs
         self.enabled = False
         self.until = 0.0
+        self.sig = FundingSignal()  # reused every call
+
+    def _emit(self, action: Action, funding_rate: float) -> FundingSignal:
+        self.sig.action = action
+        self.sig.funding = funding_rate
+        return self.sig
 
     def on_funding(self, funding_rate: float) -> FundingSignal:
         now = time.time()
 
         if self.enabled and now < self.until:
-            return FundingSignal("hold", funding_rate)
+            return self._emit(Action.HOLD, funding_rate)
 
         if funding_rate >= self.funding_min:
             self.enabled = True
             self.until = now + self.hold_hrs * 3600
-            return FundingSignal("enable", funding_rate)
+            return self._emit(Action.ENABLE, funding_rate)
 
         self.enabled = False
-        return FundingSignal("disable", funding_rate)
+        return self._emit(Action.DISABLE, funding_rate)
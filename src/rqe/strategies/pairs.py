@@ -1,43 +1,113 @@
-from dataclasses import dataclass
-from collections import deque
 import math
 import time
 
+from ..signals import Action, LABELS
+from ..sketch import RollingMoments
+
 
-@dataclass
 class PairsSignal:
-    action: str  # enter_long_spread | enter_short_spread | exit | hold
-    z: float
+    __slots__ = ("action", "z", "beta")
+
+    def __init__(self, action: Action = Action.HOLD, z: float = 0.0, beta: float = 1.0) -> None:
+        self.action = action  # ENTER_LONG_SPREAD | ENTER_SHORT_SPREAD | EXIT | HOLD
+        self.z = z
+        self.beta = beta
+
+    def __repr__(self) -> str:
+        return f"PairsSignal({LABELS[self.action]}, z={self.z:.3f}, beta={self.beta:.4f})"
+
+
+class RecursiveHedge:
+    """
+    Recursive least squares fit of log(a) = alpha + beta * log(b).
+
+    O(1) per update (2x2 covariance kept as scalars). `lam` < 1 forgets old
+    observations so the hedge ratio tracks slow regime drift. `err` is the
+    last a-priori prediction error, i.e. the spread under the fit as it stood
+    before that observation.
+    """
+
+    def __init__(self, lam: float = 0.999, beta0: float = 1.0, alpha0: float = 0.0, delta: float = 100.0) -> None:
+        self.lam = lam
+        self.alpha = alpha0
+        self.beta = beta0
+        self.p00 = delta
+        self.p01 = 0.0
+        self.p11 = delta
+        self.err = 0.0
+
+    def update(self, x: float, y: float) -> float:
+        # P @ phi with phi = [1, x]
+        px0 = self.p00 + self.p01 * x
+        px1 = self.p01 + self.p11 * x
+        denom = self.lam + px0 + x * px1
+        k0 = px0 / denom
+        k1 = px1 / denom
+
+        err = self.err = y - (self.alpha + self.beta * x)
+        self.alpha += k0 * err
+        self.beta += k1 * err
+
+        self.p00 = (self.p00 - k0 * px0) / self.lam
+        self.p01 = (self.p01 - k0 * px1) / self.lam
+        self.p11 = (self.p11 - k1 * px1) / self.lam
+        return self.beta
 
 
 class PairsMeanReversion:
-    def __init__(self, lookback: int, z_enter: float, z_exit: float, max_hold_min: int) -> None:
+    def __init__(
+        self,
+        lookback: int,
+        z_enter: float,
+        z_exit: float,
+        max_hold_min: int,
+        hedge: str = "fixed",
+        rls_lambda: float = 0.999,
+        beta0: float = 1.0,
+        alpha0: float = 0.0,
+    ) -> None:
         self.lookback = lookback
         self.z_enter = z_enter
         self.z_exit = z_exit
         self.max_hold_min = max_hold_min
 
-        self.spread = deque(maxlen=lookback)
+        # fixed: beta0 throughout (the scanner's OLS fit, else 1:1); rls: recursive hedge ratio from beta0.
+        # alpha0 only seeds the RLS intercept: a constant offset drops out of the fixed spread's z-score.
+        self.hedge = RecursiveHedge(rls_lambda, beta0, alpha0) if hedge == "rls" else None
+        self.beta = beta0
+
+        # fixed: spread = log a - beta0 * log b; rls: the hedge's prediction error. Values built
+        # on different betas are never mixed in one window: each beta update would
+        # shift the level by d(beta) * log(b) and swamp the residual.
+        self.spread = RollingMoments(lookback)
         self.in_pos = False
         self.side = None
         self.enter_ts = 0.0
+        self.sig = PairsSignal()  # reused every call
 
-    def _stats(self):
-        xs = list(self.spread)
-        m = sum(xs) / len(xs)
-        v = sum((x - m) ** 2 for x in xs) / max(1, len(xs) - 1)
-        return m, math.sqrt(v) if v > 0 else 0.0
+    def _emit(self, action: Action, z: float) -> PairsSignal:
+        sig = self.sig
+        sig.action = action
+        sig.z = z
+        sig.beta = self.beta
+        return sig
 
     def on_prices(self, a: float, b: float) -> PairsSignal:
-        s = math.log(max(1e-9, a)) - math.log(max(1e-9, b))
-        self.spread.append(s)
+        la = math.log(max(1e-9, a))
+        lb = math.log(max(1e-9, b))
+        if self.hedge is not None:
+            self.beta = self.hedge.update(lb, la)
+            s = self.hedge.err
+        else:
+            s = la - self.beta * lb
+        self.spread.push(s)
 
         if len(self.spread) < self.lookback:
-            return PairsSignal("hold", 0.0)
+            return self._emit(Action.HOLD, 0.0)
 
-        m, sd = self._stats()
+        m, sd = self.spread.mean(), self.spread.std()
         if sd == 0:
-            return PairsSignal("hold", 0.0)
+            return self._emit(Action.HOLD, 0.0)
 
         z = (s - m) / sd
 
@@ -45,32 +115,32 @@ class PairsMeanReversion:
         if self.in_pos and (time.time() - self.enter_ts) > self.max_hold_min * 60:
             self.in_pos = False
             self.side = None
-            return PairsSignal("exit", z)
+            return self._emit(Action.EXIT, z)
 
         if not self.in_pos:
             if z >= self.z_enter:
                 self.in_pos = True
                 self.side = "short_spread"
                 self.enter_ts = time.time()
-                return PairsSignal("enter_short_spread", z)
+                return self._emit(Action.ENTER_SHORT_SPREAD, z)
 
             if z <= -self.z_enter:
                 self.in_pos = True
                 self.side = "long_spread"
                 self.enter_ts = time.time()
-                return PairsSignal("enter_long_spread", z)
+                return self._emit(Action.ENTER_LONG_SPREAD, z)
 
-            return PairsSignal("hold", z)
+            return self._emit(Action.HOLD, z)
 
         # exit
         if self.side == "long_spread" and z >= -self.z_exit:
             self.in_pos = False
             self.side = None
-            return PairsSignal("exit", z)
+            return self._emit(Action.EXIT, z)
 
         if self.side == "short_spread" and z <= self.z_exit:
             self.in_pos = False
             self.side = None
-            return PairsSignal("exit", z)
+            return self._emit(Action.EXIT, z)
 
-        return PairsSignal("hold", z)
+        return self._emit(Action.HOLD, z)
@@ -1,42 +1,52 @@
-from dataclasses import dataclass
-from collections import deque
+from ..signals import Action, LABELS
+from ..sketch import RollingMoments
 
 
-@dataclass
 class TrendSignal:
-    action: str  # buy | sell | hold | flat
-    strength: float
+    __slots__ = ("action", "strength")
+
+    def __init__(self, action: Action = Action.HOLD, strength: float = 0.0) -> None:
+        self.action = action  # BUY | HOLD | FLAT
+        self.strength = strength
+
+    def __repr__(self) -> str:
+        return f"TrendSignal({LABELS[self.action]}, {self.strength:.6f})"
 
 
 class TrendFollowing:
     def __init__(self, fast: int, slow: int) -> None:
         self.fast = fast
         self.slow = slow
-        self.prices = deque(maxlen=max(fast, slow))
+        self.fast_ma = RollingMoments(fast)
+        self.slow_ma = RollingMoments(slow)
         self.in_pos = False
         self.side = None
+        self.sig = TrendSignal()  # reused every call
 
-    def _ma(self, n: int) -> float:
-        xs = list(self.prices)[-n:]
-        return sum(xs) / max(1, len(xs))
+    def _emit(self, action: Action, strength: float) -> TrendSignal:
+        sig = self.sig
+        sig.action = action
+        sig.strength = strength
+        return sig
 
     def on_price(self, price: float) -> TrendSignal:
-        self.prices.append(price)
-        if len(self.prices) < self.slow:
-            return TrendSignal("hold", 0.0)
+        self.fast_ma.push(price)
+        self.slow_ma.push(price)
+        if len(self.slow_ma) < self.slow:
+            return self._emit(Action.HOLD, 0.0)
 
-        f = self._ma(self.fast)
-        s = self._ma(self.slow)
+        f = self.fast_ma.mean()
+        s = self.slow_ma.mean()
         strength = (f - s) / s
 
         if f > s and (not self.in_pos or self.side != "long"):
             self.in_pos = True
             self.side = "long"
-            return TrendSignal("buy", strength)
+            return self._emit(Action.BUY, strength)
 
         if f < s and self.in_pos and self.side == "long":
             self.in_pos = False
             self.side = None
-            return TrendSignal("flat", strength)
+            return self._emit(Action.FLAT, strength)
 
-        return TrendSignal("hold", strength)
+        return self._emit(Action.HOLD, strength)
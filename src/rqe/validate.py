@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+class ValidationResult:
+    __slots__ = ("ok", "reason")
 
+    def __init__(self, ok: bool, reason: str) -> None:
+        self.ok = ok
+        self.reason = reason
 
-@dataclass
-class ValidationResult:
-    ok: bool
-    reason: str
+
+# results are immutable in practice, so share them instead of allocating per call
+_NO_BASELINE = ValidationResult(True, "no_baseline")
+_SPIKE = ValidationResult(False, "vol_spike")
+_OK = ValidationResult(True, "ok")
 
 
 class Validator:
@@ -21,7 +26,7 @@ class Validator:
 
     def vol_spike(self, vol_now: float, vol_baseline: float) -> ValidationResult:
         if vol_baseline <= 0:
-            return ValidationResult(True, "no_baseline")
+            return _NO_BASELINE
         if vol_now >= self.vol_spike_mult * vol_baseline:
-            return ValidationResult(False, "vol_spike")
-        return ValidationResult(True, "ok")
+            return _SPIKE
+        return _OK
@@ -0,0 +1,20 @@
+import requests
+
+from rqe.bench import _engine
+from rqe.risk import BREAKER_TRIPPED
+
+
+class _DeadFeed:
+    def price(self, symbol, out=None):
+        raise requests.Timeout("ticker")
+
+
+def test_feed_timeouts_trip_the_breaker_instead_of_raising():
+    eng = _engine(100, "iceberg")
+    for _ in range(50):
+        eng.tick()
+    eng.pub = _DeadFeed()
+    for _ in range(30):
+        eng.tick()
+    assert eng.risk.breaker.state == BREAKER_TRIPPED
+    assert eng.sched.parents == {}
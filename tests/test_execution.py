@@ -0,0 +1,219 @@
+import pytest
+import requests
+
+from rqe.broker.orders import NEW_ORDER_REJECTED, UNKNOWN_ORDER, VenueError, client_order_id
+from rqe.broker.paper import PaperBroker
+from rqe.execution import ExecCfg, ExecutionScheduler
+
+SYM = "XUSDT"
+
+
+def _sched(broker, **kw):
+    cfg = dict(style="twap", slices=4, interval_s=10.0, chase_s=1e9, passive_bps=2.0, chase_step_bps=2.0, max_cross_bps=3.0)
+    cfg.update(kw)
+    return ExecutionScheduler(broker, ExecCfg(**cfg))
+
+
+def _broker(px=100.0):
+    b = PaperBroker(fee_bps=0.0)
+    b.mark(SYM, px)
+    return b
+
+
+class Flaky:
+    """Venue wrapper whose next calls to `method` raise `exc` before (or after) reaching the venue."""
+
+    def __init__(self, venue, method, exc, times=1, reach=False):
+        self.venue = venue
+        self.method = method
+        self.exc = exc
+        self.left = times
+        self.reach = reach
+
+    def __getattr__(self, name):
+        fn = getattr(self.venue, name)
+        if name != self.method:
+            return fn
+
+        def call(*a, **kw):
+            if self.left > 0:
+                self.left -= 1
+                if self.reach:
+                    fn(*a, **kw)
+                raise self.exc
+            return fn(*a, **kw)
+
+        return call
+
+
+def test_twap_releases_one_slice_per_interval():
+    b = _broker()
+    s = _sched(b, passive_bps=-5.0)  # marketable: every child fills on arrival
+    s.submit("t", SYM, "buy", 4.0, 0.0)
+    filled = []
+    for now in (0.0, 5.0, 10.0, 20.0, 35.0):
+        filled.append(sum(f.qty for f in s.step(now, {SYM: 100.0})))
+    assert filled == pytest.approx([1.0, 0.0, 1.0, 1.0, 1.0])
+    assert b.ledger.position("t", SYM)[0] == pytest.approx(4.0)
+    assert s.parents == {}
+
+
+def test_iceberg_keeps_one_child_working():
+    b = _broker()
+    s = _sched(b, style="iceberg")
+    s.submit("t", SYM, "buy", 4.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    s.step(1.0, {SYM: 100.0})
+    assert len(b.orders) == 1 and len(b.resting) == 1
+
+    b.mark(SYM, 99.9)  # trades through the resting bid
+    fills = s.step(2.0, {SYM: 99.9})
+    assert [f.qty for f in fills] == pytest.approx([1.0])
+    assert fills[0].price == pytest.approx(100.0 * (1 - 2e-4))
+    assert len(b.orders) == 1 and len(b.resting) == 1  # filled child forgotten, next slice went straight out
+    assert client_order_id(next(iter(s.parents)), 1, 0) in b.resting
+
+
+def test_chase_replaces_and_caps_at_max_cross():
+    b = _broker(px=101.0)  # venue trades above every bid we post, so nothing fills
+    s = _sched(b, style="iceberg", slices=1, chase_s=4.0)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    prices = []
+    for now in (0.0, 4.0, 8.0, 12.0, 16.0):
+        s.step(now, {SYM: 100.0})
+        (o,) = b.resting.values()
+        prices.append(o["price"])
+    # 2 bps passive, stepping 2 bps per replace, never more than 3 bps through the mid
+    assert prices == pytest.approx([99.98, 100.0, 100.02, 100.03, 100.03])
+    assert list(b.orders) == list(b.resting)  # the 4 canceled children were forgotten
+
+
+def test_chase_respects_limit_price():
+    b = _broker()
+    s = _sched(b, style="iceberg", slices=1, chase_s=1.0)
+    s.submit("t", SYM, "buy", 1.0, 0.0, limit_px=99.99)
+    prices = []
+    for now in range(5):
+        s.step(float(now), {SYM: 100.0})
+        prices += [o["price"] for o in b.resting.values()]
+    assert max(prices) == pytest.approx(99.99)
+
+
+def test_cancel_returns_fill_that_raced_it():
+    b = _broker()
+    s = _sched(b, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    b.mark(SYM, 99.0)  # fills on the venue before the scheduler hears about it
+    fills = s.cancel("t", SYM)
+    assert [f.qty for f in fills] == pytest.approx([1.0])
+    assert fills[0].mid == 100.0
+    assert s.parents == {}
+
+
+def test_submit_returns_fills_of_replaced_parent():
+    b = PaperBroker(fee_bps=10.0)
+    b.mark(SYM, 100.0)
+    s = _sched(b, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    b.mark(SYM, 99.0)
+    fills = s.submit("t", SYM, "sell", 1.0, 1.0)
+    assert [f.qty for f in fills] == pytest.approx([1.0])
+    assert sum(f.pnl for f in fills) == pytest.approx(float(b.ledger.realized[0]))
+
+
+def test_status_timeout_never_resends():
+    b = _broker()
+    venue = Flaky(b, "order_status", requests.Timeout("status"))
+    s = _sched(venue, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    b.mark(SYM, 99.0)
+
+    assert s.step(1.0, {SYM: 99.0}) == []
+    assert len(b.orders) == 1  # nothing re-placed while the outcome was unknown
+    fills = s.step(2.0, {SYM: 99.0})
+    assert [f.qty for f in fills] == pytest.approx([1.0])
+    assert b.ledger.position("t", SYM)[0] == pytest.approx(1.0)
+    assert b.resting == {} and s.parents == {}
+
+
+def test_place_that_never_arrived_is_resent_under_same_id():
+    b = _broker()
+    venue = Flaky(b, "place_limit", requests.ConnectionError("place"))
+    s = _sched(venue, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    assert b.orders == {}
+    s.step(1.0, {SYM: 100.0})  # venue: unknown order -> resend
+    (cid,) = b.orders
+    assert cid == client_order_id(next(iter(s.parents)), 0, 0)
+
+
+def test_place_timeout_after_arrival_is_not_duplicated():
+    b = _broker()
+    venue = Flaky(b, "place_limit", requests.Timeout("place"), reach=True)
+    s = _sched(venue, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    s.step(1.0, {SYM: 100.0})
+    assert len(b.orders) == 1 and len(b.resting) == 1
+
+
+def test_rejected_place_drops_the_parent(caplog):
+    b = _broker()
+    venue = Flaky(b, "place_limit", VenueError(-1013, "Filter failure: LOT_SIZE"), times=100)
+    s = _sched(venue, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    for now in range(5):
+        s.step(float(now), {SYM: 100.0})
+    assert s.parents == {} and b.orders == {}
+    assert venue.left == 99  # placed once, never retried
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 1
+
+
+def test_duplicate_reject_keeps_the_child_working():
+    b = _broker()
+    venue = Flaky(b, "place_limit", VenueError(NEW_ORDER_REJECTED, "Duplicate order sent."), reach=True)
+    s = _sched(venue, style="iceberg", slices=1)
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+    assert len(s.parents) == 1 and len(b.resting) == 1
+    b.mark(SYM, 99.0)
+    assert [f.qty for f in s.step(1.0, {SYM: 99.0})] == pytest.approx([1.0])
+
+
+def test_cancel_all_pulls_every_child():
+    b = _broker()
+    b.mark("YUSDT", 50.0)
+    s = _sched(b, style="iceberg")
+    s.submit("t", SYM, "buy", 4.0, 0.0)
+    s.submit("p", "YUSDT", "sell", 4.0, 0.0)
+    s.step(0.0, {SYM: 100.0, "YUSDT": 50.0})
+    assert len(b.resting) == 2
+    assert s.cancel_all() == []
+    assert b.resting == {} and s.parents == {}
+
+
+def test_closed_children_are_forgotten():
+    b = _broker()
+    s = _sched(b, passive_bps=-5.0, interval_s=1.0, slices=1000)
+    s.submit("t", SYM, "buy", 1000.0, 0.0)
+    for now in range(1000):
+        s.step(float(now), {SYM: 100.0})
+    assert b.ledger.position("t", SYM)[0] == pytest.approx(1000.0)
+    assert b.orders == {} and s.parents == {}
+
+
+def test_paper_ids_follow_venue_rules():
+    b = _broker()
+    b.place_limit(SYM, "buy", 1.0, 90.0, "cid")
+    with pytest.raises(VenueError) as e:
+        b.place_limit(SYM, "buy", 1.0, 90.0, "cid")
+    assert e.value.code == NEW_ORDER_REJECTED
+    b.cancel(SYM, "cid")
+    assert b.place_limit(SYM, "buy", 1.0, 90.0, "cid").status == "NEW"  # closed ids are reusable
+    with pytest.raises(VenueError) as e:
+        b.order_status(SYM, "nope")
+    assert e.value.code == UNKNOWN_ORDER
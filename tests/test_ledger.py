@@ -0,0 +1,67 @@
+import pytest
+
+from rqe.broker.ledger import PositionLedger
+
+
+def test_adds_at_average_cost():
+    led = PositionLedger()
+    i = led.slot("trend", "BTCUSDT")
+    assert led.apply(i, 1.0, 100.0, 0.0) == 0.0
+    assert led.apply(i, 3.0, 120.0, 0.0) == 0.0
+    assert led.position("trend", "BTCUSDT") == (4.0, pytest.approx(115.0))
+
+
+def test_partial_close_realizes_and_keeps_avg():
+    led = PositionLedger()
+    i = led.slot("trend", "BTCUSDT")
+    led.apply(i, 2.0, 100.0, 0.0)
+    pnl = led.apply(i, -0.5, 110.0, 0.25)
+    assert pnl == pytest.approx(0.5 * 10.0 - 0.25)
+    assert led.position("trend", "BTCUSDT") == (1.5, 100.0)
+    assert led.realized[i] == pytest.approx(pnl)
+
+
+def test_short_cover_realizes_with_sign():
+    led = PositionLedger()
+    i = led.slot("pairs", "ETHUSDT")
+    led.apply(i, -2.0, 50.0, 0.0)
+    assert led.apply(i, 2.0, 45.0, 0.0) == pytest.approx(10.0)
+    assert led.position("pairs", "ETHUSDT") == (0.0, 0.0)
+
+
+def test_flip_through_zero_opens_remainder_at_fill_price():
+    led = PositionLedger()
+    i = led.slot("trend", "BTCUSDT")
+    led.apply(i, 1.0, 100.0, 0.0)
+    pnl = led.apply(i, -3.0, 90.0, 0.0)
+    assert pnl == pytest.approx(-10.0)  # only the closed 1.0 realizes
+    assert led.position("trend", "BTCUSDT") == (-2.0, 90.0)
+    assert led.apply(i, 2.0, 80.0, 0.0) == pytest.approx(20.0)
+
+
+def test_fee_is_charged_on_opening_fills():
+    led = PositionLedger()
+    i = led.slot("trend", "BTCUSDT")
+    assert led.apply(i, 1.0, 100.0, 0.1) == pytest.approx(-0.1)
+    assert led.realized[i] == pytest.approx(-0.1)
+
+
+def test_strategies_do_not_share_inventory():
+    led = PositionLedger()
+    a = led.slot("trend", "BTCUSDT")
+    b = led.slot("pairs", "BTCUSDT")
+    led.apply(a, 1.0, 100.0, 0.0)
+    led.apply(b, -1.0, 100.0, 0.0)
+    assert led.position("trend", "BTCUSDT") == (1.0, 100.0)
+    assert led.position("pairs", "BTCUSDT") == (-1.0, 100.0)
+
+
+def test_vector_views_and_growth():
+    led = PositionLedger(capacity=2)
+    for k in range(5):
+        led.apply(led.slot(f"s{k}", f"SYM{k}"), 1.0 if k % 2 == 0 else -1.0, 10.0, 0.0)
+        led.mark(f"SYM{k}", 12.0)
+    assert len(led) == 5
+    assert list(led.unrealized()) == pytest.approx([2.0, -2.0, 2.0, -2.0, 2.0])
+    assert led.exposure().sum() == pytest.approx(60.0)
+    assert led.by_strategy(led.unrealized())["s1"] == pytest.approx(-2.0)
@@ -0,0 +1,108 @@
+import pytest
+import requests
+
+from rqe.broker.live_binance_spot import BinanceSpotLive
+from rqe.broker.orders import NEW_ORDER_REJECTED, VenueError
+from rqe.execution import ExecCfg, ExecutionScheduler
+from rqe.mockex import MockCfg, MockExchange, serve
+
+SYM = "XUSDT"
+
+
+@pytest.fixture
+def mock():
+    # tick_hz=0 freezes the path; tests move the price by rewriting the script
+    ex = MockExchange({SYM: 100.0}, MockCfg(tick_hz=0.0), scripts={SYM: [100.0]})
+    server = serve(ex)
+    yield ex, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _move(ex, px):
+    ex.paths[SYM].script[:] = [px]
+
+
+def test_book_only_the_new_delta():
+    v = BinanceSpotLive("k", "s", fee_bps=0.0)
+    v._booked["c1"] = ("t", 0.0, 0.0)
+    v._book(SYM, "BUY", "c1", {"executedQty": "0.4", "cummulativeQuoteQty": "40.0"})
+    v._book(SYM, "BUY", "c1", {"executedQty": "0.4", "cummulativeQuoteQty": "40.0"})  # repeat status
+    assert v.ledger.position("t", SYM) == (pytest.approx(0.4), pytest.approx(100.0))
+    v._book(SYM, "BUY", "c1", {"executedQty": "1.0", "cummulativeQuoteQty": "101.2"})
+    # the new 0.6 cost 61.2, i.e. 102.0; booked at that, the average is the order's own 101.2
+    assert v.ledger.position("t", SYM) == (pytest.approx(1.0), pytest.approx(101.2))
+
+
+def test_repeated_status_books_once(mock):
+    ex, base = mock
+    v = BinanceSpotLive("k", "s", rps=1e6, base=base)
+    v.place_limit(SYM, "buy", 1.0, 99.5, "c1", strategy="t")
+    _move(ex, 99.0)
+    for _ in range(3):
+        assert v.order_status(SYM, "c1").status == "FILLED"
+    assert v.ledger.position("t", SYM)[0] == pytest.approx(1.0)
+
+
+def test_duplicate_open_id_raises_venue_error(mock):
+    _, base = mock
+    v = BinanceSpotLive("k", "s", rps=1e6, base=base)
+    v.place_limit(SYM, "buy", 1.0, 90.0, "c1", strategy="t")
+    with pytest.raises(VenueError) as e:
+        v.place_limit(SYM, "buy", 1.0, 90.0, "c1", strategy="t")
+    assert e.value.code == NEW_ORDER_REJECTED
+
+
+def test_status_timeout_does_not_double_fill(mock):
+    ex, base = mock
+    v = BinanceSpotLive("k", "s", rps=1e6, base=base)
+    s = ExecutionScheduler(v, ExecCfg(style="iceberg", slices=1, chase_s=1e9))
+    s.submit("t", SYM, "buy", 1.0, 0.0)
+    s.step(0.0, {SYM: 100.0})
+
+    _move(ex, 99.0)
+    status = v.order_status
+    calls = []
+
+    def flaky(symbol, cid):
+        calls.append(cid)
+        if len(calls) == 1:
+            ex.price(SYM)  # the child fills on the venue, but the reply is lost
+            raise requests.Timeout("status")
+        return status(symbol, cid)
+
+    v.order_status = flaky
+    assert s.step(1.0, {SYM: 99.0}) == []
+    fills = s.step(2.0, {SYM: 99.0})
+
+    assert [f.qty for f in fills] == pytest.approx([1.0])
+    assert [o["status"] for o in ex.orders.values()] == ["FILLED"]
+    assert ex.resting[SYM] == {}
+    assert v.ledger.position("t", SYM)[0] == pytest.approx(1.0)
+    assert v._booked == {}  # settled child forgotten
+
+
+def test_order_endpoints_are_timed(mock):
+    _, base = mock
+    v = BinanceSpotLive("k", "s", rps=1e6, base=base)
+    seen = []
+    v.on_latency = lambda endpoint, ms: seen.append((endpoint, ms))
+    v.place_limit(SYM, "buy", 1.0, 90.0, "c1", strategy="t")
+    v.order_status(SYM, "c1")
+    v.cancel(SYM, "c1")
+    with pytest.raises(VenueError):
+        v.cancel(SYM, "c1")  # rejected calls are timed too
+    assert [e for e, _ in seen] == ["order/place", "order/status", "order/cancel", "order/cancel"]
+    assert all(ms > 0 for _, ms in seen)
+
+
+def test_mock_rejects_unknown_symbol_on_every_order_route(mock):
+    _, base = mock
+    v = BinanceSpotLive("k", "s", rps=1e6, base=base)
+    for call in (
+        lambda: v.place_limit("NOPEUSDT", "buy", 1.0, 90.0, "c1"),
+        lambda: v.order_status("NOPEUSDT", "c1"),
+        lambda: v.cancel("NOPEUSDT", "c1"),
+    ):
+        with pytest.raises(VenueError) as e:
+            call()
+        assert e.value.code == -1121
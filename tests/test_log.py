@@ -0,0 +1,40 @@
+import json
+import logging
+import queue
+
+from rqe.log import DropQueueHandler, JsonFormatter, SampleFilter, parse_sample
+from rqe.metrics import LOG_DROPPED
+
+
+def _record(kind=None):
+    r = logging.LogRecord("t", logging.INFO, "", 0, "m", None, None)
+    if kind:
+        r.kind = kind
+    return r
+
+
+def test_sample_filter_keeps_one_in_n_per_kind():
+    f = SampleFilter(parse_sample("tick=3, fill=1"))
+    assert [f.filter(_record("tick")) for _ in range(6)] == [True, False, False, True, False, False]
+    assert all(f.filter(_record("fill")) for _ in range(3))
+    assert all(f.filter(_record()) for _ in range(3))
+
+
+def test_presampled_records_are_not_counted_twice():
+    f = SampleFilter({"tick": 2})
+    assert f.take("tick")
+    r = _record("tick")
+    r.sampled = True
+    assert f.filter(r) and f.filter(r)
+    assert not f.take("tick")  # the pre-sampled records did not use up slots
+    assert "sampled" not in json.loads(JsonFormatter().format(r))
+
+
+def test_full_queue_drops_and_counts():
+    h = DropQueueHandler(queue.Queue(maxsize=2))
+    before = LOG_DROPPED._value.get()
+    for _ in range(5):
+        h.handle(_record())
+    assert h.queue.qsize() == 2
+    assert h.dropped == 3
+    assert LOG_DROPPED._value.get() - before == 3
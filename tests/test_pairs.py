@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pytest
+
+from rqe.scanner import _half_life, scan
+from rqe.signals import Action
+from rqe.strategies.pairs import PairsMeanReversion, RecursiveHedge
+
+
+def _pair(n=2000, beta=1.5, alpha=0.1, phi=0.9, seed=3):
+    """log b is a random walk; log a = alpha + beta * log b + AR(1) residual."""
+    rng = np.random.default_rng(seed)
+    lb = math.log(100.0) + np.cumsum(rng.normal(0.0, 0.01, n))
+    resid = np.zeros(n)
+    for t in range(1, n):
+        resid[t] = phi * resid[t - 1] + rng.normal(0.0, 0.002)
+    return alpha + beta * lb + resid, lb, resid
+
+
+def test_recursive_hedge_recovers_the_fit():
+    la, lb, _ = _pair()
+    h = RecursiveHedge(lam=1.0)
+    for x, y in zip(lb, la):
+        h.update(x, y)
+    assert h.beta == pytest.approx(1.5, abs=0.05)
+    assert h.alpha + h.beta * lb.mean() == pytest.approx(la.mean(), abs=1e-3)
+
+
+def test_recursive_hedge_err_is_a_priori():
+    h = RecursiveHedge(beta0=2.0, alpha0=1.0)
+    h.update(3.0, 8.0)
+    assert h.err == pytest.approx(8.0 - (1.0 + 2.0 * 3.0))
+
+
+def test_rls_z_tracks_the_true_residual():
+    la, lb, resid = _pair()
+    m = PairsMeanReversion(100, 2.0, 0.5, 10**9, hedge="rls", rls_lambda=0.999, beta0=1.5, alpha0=0.1)
+    z = []
+    for a, b in zip(np.exp(la), np.exp(lb)):
+        z.append(m.on_prices(a, b).z)
+    assert m.beta == pytest.approx(1.5, abs=0.1)
+    assert np.corrcoef(z[500:], resid[500:])[0, 1] > 0.9
+
+
+def test_fixed_hedge_uses_beta0():
+    la, lb, resid = _pair()
+    m = PairsMeanReversion(100, 2.0, 0.5, 10**9, beta0=1.5, alpha0=0.1)
+    z = [m.on_prices(a, b).z for a, b in zip(np.exp(la), np.exp(lb))]
+    assert m.sig.beta == 1.5
+    assert np.corrcoef(z[500:], resid[500:])[0, 1] > 0.9
+
+
+def test_fixed_hedge_enters_and_exits_on_the_spread():
+    m = PairsMeanReversion(20, 2.0, 0.5, 10**9, beta0=1.0)
+    rng = np.random.default_rng(0)
+    for e in rng.normal(0.0, 1e-3, 20):
+        assert m.on_prices(100.0 * math.exp(e), 100.0).action == Action.HOLD
+    assert m.on_prices(100.0 * math.exp(0.01), 100.0).action == Action.ENTER_SHORT_SPREAD
+    assert m.on_prices(100.0, 100.0).action == Action.EXIT
+
+
+def test_half_life():
+    assert _half_life(-0.1) == pytest.approx(math.log(2.0) / -math.log(0.9))
+    assert _half_life(-0.5) == pytest.approx(1.0)
+    assert _half_life(0.0) == math.inf
+    assert _half_life(-1.0) == math.inf
+
+
+def test_scan_finds_the_cointegrated_pair_once():
+    la, lb, _ = _pair()
+    rng = np.random.default_rng(9)
+    prices = {
+        "A": np.exp(la),
+        "B": np.exp(lb),
+        "W": 50.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, len(la)))),  # independent walk
+    }
+    (c,) = scan(prices, workers=1)
+    assert {c.a, c.b} == {"A", "B"}
+    if c.a == "A":
+        assert c.beta == pytest.approx(1.5, abs=0.05)
+    assert c.half_life == pytest.approx(_half_life(-0.1), rel=0.3)
+    assert c.adf_t < -3.34
+
+
+def test_scan_drops_negative_hedge_ratios():
+    la, lb, _ = _pair(beta=-1.0, alpha=10.0)
+    prices = {"A": np.exp(la), "B": np.exp(lb)}
+    assert scan(prices, workers=1) == []
+    (c,) = scan(prices, workers=1, min_beta=-math.inf)
+    assert c.beta < 0
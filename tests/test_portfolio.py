@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from rqe.portfolio import EwmaCov, RiskAllocator, risk_parity
+
+
+def _returns(n, vols, seed=1):
+    return np.random.default_rng(seed).normal(0.0, 1.0, (n, len(vols))) * np.asarray(vols)
+
+
+def test_ewma_cov_matches_direct_sum():
+    lam, r = 0.9, _returns(200, [0.01, 0.02, 0.03])
+    est = EwmaCov(3, lam)
+    for row in r:
+        est.update(row)
+
+    mean, cov = r[0].copy(), np.zeros((3, 3))
+    for row in r[1:]:
+        d = row - mean
+        mean += (1 - lam) * d
+        cov = lam * cov + lam * (1 - lam) * np.outer(d, d)
+    assert est.mean == pytest.approx(mean)
+    assert est.cov == pytest.approx(cov)
+    assert est.vol() == pytest.approx(np.sqrt(np.diag(cov)))
+
+
+def test_risk_parity_equalizes_risk_contributions():
+    vol = np.array([0.01, 0.02, 0.04])
+    corr = np.array([[1.0, 0.3, 0.1], [0.3, 1.0, 0.2], [0.1, 0.2, 1.0]])
+    cov = corr * np.outer(vol, vol)
+    w = risk_parity(cov)
+    rc = w * (cov @ w)
+    assert w.sum() == pytest.approx(1.0)
+    assert rc == pytest.approx(np.full(3, rc.mean()), rel=1e-6)
+    assert w[0] > w[1] > w[2]
+
+
+def test_risk_parity_uncorrelated_is_inverse_vol():
+    vol = np.array([0.01, 0.03])
+    w = risk_parity(np.diag(vol**2))
+    assert w == pytest.approx([0.75, 0.25])
+
+
+def test_static_keeps_base_weights():
+    a = RiskAllocator(np.array([0.35, 0.35, 0.30]), vol_targets=np.array([0.007, 0.0, 0.0]), min_obs=5)
+    for row in _returns(100, [0.01, 0.002, 0.0]):
+        assert not a.update(row)
+    assert a.weights == pytest.approx([0.35, 0.35, 0.30])
+    assert a.allocate(1000.0) == pytest.approx([350.0, 350.0, 300.0])
+
+
+def test_risk_parity_leaves_disabled_sleeve_at_zero():
+    a = RiskAllocator(np.array([0.5, 0.0, 0.5]), method="risk_parity", min_obs=5)
+    for row in _returns(100, [0.01, 0.02, 0.03]):
+        a.update(row)
+    assert a.weights[1] == 0.0
+    assert a.weights.sum() == pytest.approx(1.0)
+    assert a.weights[0] > a.weights[2]
+
+
+def test_vol_target_scales_down_and_keeps_the_rest_in_cash():
+    a = RiskAllocator(
+        np.array([0.5, 0.5, 0.0]), method="vol_target", vol_targets=np.array([0.01, 0.0, 0.0]),
+        periods_per_day=100.0, min_obs=5,
+    )
+    for row in _returns(400, [0.004, 0.004, 0.0]):  # ~4% daily on sleeve 0
+        a.update(row)
+    assert a.weights[0] == pytest.approx(0.5 * 0.01 / (a.est.vol()[0] * 10.0), rel=0.1)
+    assert a.weights[0] < 0.2 and a.weights[1] == 0.5
+
+
+def test_resolves_only_when_covariance_moves():
+    a = RiskAllocator(np.array([0.5, 0.5]), method="risk_parity", lam=0.99, tol=0.05, min_obs=10)
+    calm = _returns(600, [0.01, 0.01])
+    for row in calm:
+        a.update(row)
+    settled = a.solves
+    for row in calm[:50]:
+        a.update(row)
+    assert a.solves - settled < 10  # a stable covariance mostly reuses the cached weights
+    settled = a.solves
+
+    for row in _returns(50, [0.05, 0.01], seed=2):
+        a.update(row)
+    assert a.solves - settled >= 10
+    assert a.weights[0] < a.weights[1]
@@ -0,0 +1,96 @@
+import pytest
+
+from rqe.risk import BREAKER_DEGRADED, BREAKER_OK, BREAKER_TRIPPED, LatencyBreaker, RiskCfg
+
+
+def _breaker(**kw):
+    cfg = dict(
+        max_notional_usd=100.0,
+        max_daily_loss_pct=0.02,
+        daily_take_profit_pct=0.03,
+        max_trades_per_day=10,
+        max_slippage_bps=10.0,
+        max_api_latency_ms=100,
+        halt_on_vol_spike=False,
+        vol_spike_mult=3.0,
+        breaker_quantile=0.9,
+        breaker_window=40,
+        breaker_recover_ticks=5,
+        breaker_stale_ticks=50,
+    )
+    cfg.update(kw)
+    return LatencyBreaker(RiskCfg(**cfg))
+
+
+def _feed(b, ms, n, kind="latency"):
+    states = []
+    for _ in range(n):
+        if kind == "latency":
+            b.observe_latency("ticker/price", ms)
+        else:
+            b.observe_slippage("order/fill", ms)
+        states.append(b.update())
+    return states
+
+
+def test_trips_immediately_and_steps_down_with_hysteresis():
+    b = _breaker()
+    assert _feed(b, 10.0, 40)[-1] == BREAKER_OK
+    assert _feed(b, 300.0, 20)[-1] == BREAKER_TRIPPED
+    assert b.scale() == 0.0
+
+    states = _feed(b, 10.0, 200)
+    assert BREAKER_DEGRADED in states
+    first_ok = states.index(BREAKER_OK)
+    # one level at a time, each after recover_ticks calm updates
+    assert states[first_ok - 5 : first_ok] == [BREAKER_DEGRADED] * 5
+    assert states[-1] == BREAKER_OK and b.scale() == 1.0
+
+
+def test_degrades_between_degrade_at_and_bound():
+    b = _breaker()
+    assert _feed(b, 85.0, 40)[-1] == BREAKER_DEGRADED
+    assert b.scale() == 0.5
+
+
+def test_no_step_down_while_ratio_hovers_near_threshold():
+    b = _breaker()
+    _feed(b, 85.0, 40)
+    assert set(_feed(b, 70.0, 200)) == {BREAKER_DEGRADED}  # 0.7 >= 0.8 * 0.75
+
+
+def test_adverse_slippage_only():
+    b = _breaker()
+    assert _feed(b, -50.0, 40, kind="slippage")[-1] == BREAKER_OK  # price improvement
+    assert b.quantiles().__next__()[2] == 0.0
+
+
+def test_stale_sketch_is_dropped_and_reported():
+    b = _breaker()
+    assert _feed(b, 5.0, 30, kind="slippage")[-1] == BREAKER_OK
+    for _ in range(49):
+        b.observe_latency("ticker/price", 10.0)
+        b.update()
+        assert b.dropped == []
+    b.observe_latency("ticker/price", 10.0)
+    b.update()
+    assert b.dropped == [("slippage_bps", "order/fill")]
+    assert [k for k, _, _ in b.quantiles()] == ["latency_ms"]
+
+
+def test_stale_slippage_no_longer_holds_the_breaker_tripped():
+    b = _breaker()
+    _feed(b, 50.0, 30, kind="slippage")
+    assert b.state == BREAKER_TRIPPED
+    states = [b.update() for _ in range(200)]  # nothing trades while tripped
+    assert states[-1] == BREAKER_OK
+    assert b.sketches == {}
+
+
+def test_cap_notional_scales_with_state():
+    from rqe.risk import RiskManager
+
+    r = RiskManager(_breaker().cfg)
+    assert r.cap_notional(500.0) == pytest.approx(100.0)
+    _feed(r.breaker, 300.0, 20)
+    assert r.cap_notional(500.0) == 0.0
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from rqe.sketch import P2Quantile, RollingMoments, WindowedQuantile
+
+
+@pytest.mark.parametrize("p", [0.5, 0.9, 0.99])
+def test_p2_tracks_the_sample_quantile(p):
+    xs = np.random.default_rng(5).lognormal(0.0, 0.5, 20_000)
+    q = P2Quantile(p)
+    for x in xs:
+        q.add(float(x))
+    assert q.value() == pytest.approx(float(np.quantile(xs, p)), rel=0.03)
+
+
+def test_p2_small_counts_are_exact_order_statistics():
+    q = P2Quantile(0.5)
+    assert q.value() == 0.0
+    for x in (5.0, 1.0, 3.0):
+        q.add(x)
+    assert q.value() == 3.0
+
+
+def test_windowed_quantile_forgets_after_a_clean_window():
+    w = WindowedQuantile(0.99, window=200)
+    for _ in range(200):
+        w.add(500.0)  # bad window
+    assert w.value() == pytest.approx(500.0)
+    for _ in range(100):
+        w.add(10.0)
+    assert w.value() == pytest.approx(500.0)  # still remembered while the bad window is the previous one
+    for _ in range(100):
+        w.add(10.0)
+    assert w.value() == pytest.approx(10.0)
+
+
+def test_windowed_quantile_reacts_within_the_current_window():
+    w = WindowedQuantile(0.9, window=1000, min_samples=20)
+    for _ in range(19):
+        w.add(100.0)
+    assert w.value() == 0.0  # below min_samples
+    w.add(100.0)
+    assert w.value() == pytest.approx(100.0)
+
+
+def test_rolling_moments_match_numpy():
+    xs = 1e4 + np.random.default_rng(2).normal(0.0, 1.0, 500)
+    m = RollingMoments(50, resync=64)
+    for x in xs:
+        m.push(float(x))
+    assert len(m) == 50
+    assert m.mean() == pytest.approx(xs[-50:].mean())
+    assert m.std() == pytest.approx(xs[-50:].std(ddof=1), rel=1e-9)